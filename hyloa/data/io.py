@@ -19,7 +19,15 @@
 Code to handle data input and output, i.e. loading and saving data
 """
 import os
+import re
+import sys
+import mmap
 import shutil
+import hashlib
+import weakref
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas as pd
 
@@ -31,12 +39,36 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt
 
+# Skip per-file icon lookups and symlink resolution, which make the
+# dialog slow to open on large or network mounted directories
+FILE_DIALOG_OPTIONS = QFileDialog.DontUseCustomDirectoryIcons | QFileDialog.DontResolveSymlinks
+
+# Extensions listed by the fast file picker
+DATA_EXTENSIONS = (".txt", ".csv", ".dat")
+
+# Maximum number of files read at the same time by load_files
+MAX_READ_WORKERS = 8
+
+# Number of data rows shown in the column selection preview
+PREVIEW_ROWS = 200
+
+# Number of rows formatted at once when saving data
+SAVE_CHUNK_ROWS = 65536
+
+# Header lengths already computed, keyed by (path, mtime, size, sep)
+HEADER_CACHE_SIZE = 128
+_header_cache     = OrderedDict()
+_header_lock      = threading.Lock()
+
+# Last save of each loaded dataframe, keyed by id(df) and dropped with the
+# dataframe, kept out of df.attrs so it is never stored in sessions
+_last_saved = {}
 
 #==============================================================================================#
 # File upload functions                                                                        #
 #==============================================================================================#
 
-def load_files(app_instance):
+def load_files(app_instance, *, reader=None):
     '''
     Function to upload a file chosen by the user.
     If the file has an header, this will be preserved when the data is
@@ -45,22 +77,36 @@ def load_files(app_instance):
     Parameters
     ----------
     app_instance : instance of MainApp from main_window.py
+    reader : callable, optional
+        function that takes a file path and returns the list of column
+        names of the file, by default read_header
     '''
+    if reader is None:
+        reader = read_header
+
     if app_instance.logger is None:
         QMessageBox.critical(None, "Error", "Cannot start analysis without starting log")
         return
 
-    file_paths, _ = QFileDialog.getOpenFileNames(
-        None,
-        "Select a file",
-        "",
-        "Text Files (*.txt);;All Files (*)"
-    )
+    if os.environ.get("HYLOA_FAST_PICKER") == "1":
+        file_paths = pick_files_fast()
+    else:
+        file_paths, _ = QFileDialog.getOpenFileNames(
+            None,
+            "Select a file",
+            "",
+            "Text Files (*.txt);;All Files (*)",
+            options=FILE_DIALOG_OPTIONS
+        )
 
     if not file_paths:
         return
 
-    for file_path in file_paths:
+    # Headers are read in parallel, dialogs stay on the GUI thread
+    with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(file_paths))) as ex:
+        headers = [ex.submit(reader, file_path) for file_path in file_paths]
+
+    for file_path, future in zip(file_paths, headers):
 
         filename = os.path.basename(file_path)
 
@@ -82,13 +128,7 @@ def load_files(app_instance):
             index_to_replace = None  # new file
 
         try:
-            if detect_header_length(file_path) == -1:
-                data   = np.loadtxt(file_path, max_rows=1)
-                n_col  = data.size
-                header = [f"col_{i}" for i in range(n_col)]
-            else:
-                with open(file_path, "r", encoding='utf-8') as f:
-                    header = f.readline().strip().split("\t")
+            header = future.result()
 
             app_instance.logger.info(f"Opening file {file_path}")
             show_column_selection(app_instance, file_path, header, index_to_replace)
@@ -98,11 +138,161 @@ def load_files(app_instance):
 
 #==============================================================================================#
 
+def list_data_files(dir_path, exts=DATA_EXTENSIONS):
+    '''
+    List the data files of a directory. Entries are filtered by name
+    with os.scandir, so no file is stat-ed except the candidates.
+
+    Parameters
+    ----------
+    dir_path : string
+        directory to list
+    exts : tuple of str
+        accepted extensions, lower case
+
+    Return
+    ------
+    files : list of str
+        sorted names of the files
+    '''
+    with os.scandir(dir_path) as entries:
+        return sorted(
+            e.name for e in entries
+            if e.name.lower().endswith(exts) and e.is_file()
+        )
+
+#==============================================================================================#
+
+def pick_files_fast(parent=None):
+    '''
+    Lightweight replacement of QFileDialog.getOpenFileNames for huge or
+    network mounted directories: the user chooses a folder and then the
+    files from a plain list. Enabled by setting HYLOA_FAST_PICKER=1.
+
+    Parameters
+    ----------
+    parent : QWidget, optional
+        parent widget of the dialogs
+
+    Return
+    ------
+    file_paths : list of str
+        paths of the selected files, empty if cancelled
+    '''
+    dir_path = QFileDialog.getExistingDirectory(
+        parent, "Select a folder", "",
+        QFileDialog.ShowDirsOnly | FILE_DIALOG_OPTIONS
+    )
+    if not dir_path:
+        return []
+
+    dialog = QDialog(parent)
+    dialog.setWindowTitle(f"Select files: {dir_path}")
+    dialog.setMinimumSize(400, 500)
+    layout = QVBoxLayout(dialog)
+
+    file_list = QListWidget()
+    file_list.setSelectionMode(QListWidget.ExtendedSelection)
+    file_list.addItems(list_data_files(dir_path))
+    file_list.itemDoubleClicked.connect(dialog.accept)
+    layout.addWidget(file_list)
+
+    open_button = QPushButton("Open")
+    open_button.clicked.connect(dialog.accept)
+    layout.addWidget(open_button)
+
+    if dialog.exec_() != QDialog.Accepted:
+        return []
+
+    return [os.path.join(dir_path, item.text()) for item in file_list.selectedItems()]
+
+#==============================================================================================#
+
+def read_header(file_path):
+    '''
+    Read the column names of a file. If the file has no header,
+    default names col_0, col_1, ... are used.
+
+    Parameters
+    ----------
+    file_path : string
+        path of the file to read
+
+    Return
+    ------
+    header : list of str
+        names of the columns
+    '''
+    if detect_header_length(file_path) == -1:
+        data   = np.loadtxt(file_path, max_rows=1)
+        n_col  = data.size
+        header = [f"col_{i}" for i in range(n_col)]
+    else:
+        with open(file_path, "r", encoding='utf-8') as f:
+            header = f.readline().strip().split("\t")
+
+    # Files from the same instrument share the same names, keep one copy
+    return [sys.intern(name) for name in header]
+
+#==============================================================================================#
+
+# Building blocks of the numeric row patterns of detect_header_length
+_BLANKS = b" \t\r\f\v"
+# Everything float() accepts, except the underscores
+_NUMBER = rb"[-+]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?|(?i:inf(?:inity)?|nan))"
+
+# Compiled patterns for each separator already seen
+_row_patterns = {}
+
+def _numeric_row_patterns(sep):
+    '''
+    Return the byte patterns used by detect_header_length,
+    compiled the first time a separator is used.
+
+    Parameters
+    ----------
+    sep : string
+        separator between the columns
+
+    Return
+    ------
+    numeric_row : re.Pattern
+        matches a line made only of numbers, at least two of them
+    empty_row : re.Pattern
+        matches a line whose first field is empty
+    '''
+    if sep in _row_patterns:
+        return _row_patterns[sep]
+
+    sep_b  = sep.encode("utf-8")
+    sep_re = re.escape(sep_b)
+    lead   = b"[" + re.escape(_BLANKS) + b"]*"
+    # Blanks around a field, i.e. whitespace that is not a separator
+    pad    = b"[" + re.escape(bytes(c for c in _BLANKS if c not in sep_b)) + b"]*"
+
+    numeric_row = re.compile(
+        rb"(?m)^" + lead + _NUMBER + rb"(?:" + pad + sep_re + pad + _NUMBER + rb")+" + lead + rb"$"
+    )
+
+    # Leading whitespace is stripped first, so only a non blank separator
+    # can leave the first field empty on a line that has some text
+    empty = rb"(?m)^" + lead + rb"(?:$"
+    if sep.strip():
+        empty += rb"|" + pad + sep_re
+    empty_row = re.compile(empty + rb")")
+
+    _row_patterns[sep] = (numeric_row, empty_row)
+    return _row_patterns[sep]
+
+# The tab separated layout is by far the most common one
+_numeric_row_patterns("\t")
+
 def detect_header_length(file_path, sep='\t'):
     '''
     Function to compute the length of the header and therefore,
     the number of rows to exclude from the dataframe to obtain a
     dataframe that has for each column only the data of interest.
+    The result is cached until the file is modified.
 
     Parameters
     ----------
@@ -116,40 +306,81 @@ def detect_header_length(file_path, sep='\t'):
     data_start : int
         number of the not empty lines of the file's header
     '''
-    with open(file_path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
+    stat = os.stat(file_path)
+    key  = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size, sep)
 
-    data_start  = None
-    empty_lines = 0
-    
-    def is_float(s):
-        try:
-            float(s)
-            return True
-        except Exception:
-            return False
-
-    # Find the first row with no letter
-    for i, line in enumerate(lines):
-        parts         = [x.strip() for x in line.strip().split(sep)]
-        numeric_parts = [x for x in parts if is_float(x)]
-        
-        if parts[0] == '':
-            empty_lines += 1
-        
-        if len(numeric_parts) == len(parts) and len(parts) > 1:
-            data_start = i
-            break
+    with _header_lock:
+        if key in _header_cache:
+            _header_cache.move_to_end(key)
+            return _header_cache[key]
+
+    data_start = _scan_header_length(file_path, sep)
+
+    with _header_lock:
+        _header_cache[key] = data_start
+        if len(_header_cache) > HEADER_CACHE_SIZE:
+            _header_cache.popitem(last=False)
+
+    return data_start
+
+def _scan_header_length(file_path, sep):
+    '''
+    Scan the file for its header length, see detect_header_length.
+    The file is memory mapped and scanned with a single regex,
+    so only the header is actually visited.
+    '''
+    numeric_row, empty_row = _numeric_row_patterns(sep)
+
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError("No valid data found.")
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+
+            # Find the first row with no letter
+            match = numeric_row.search(mm)
+            if match is None:
+                raise ValueError("No valid data found.")
+
+            # The header ends before the newline that precedes the match
+            header      = mm[:max(match.start() - 1, 0)]
+            data_start  = header.count(b"\n") + (match.start() > 0)
+            empty_lines = len(empty_row.findall(header)) if match.start() else 0
 
-    if data_start is None:
-        raise ValueError("No valid data found.")
-    
     data_start = data_start - 1 - empty_lines
-    
+
     return data_start
 
 #==============================================================================================#
 
+def read_data(file_path, sep='\t', usecols=None):
+    '''
+    Read a whole data file into a dataframe, header lines included.
+    The multithreaded pyarrow parser is used when available, otherwise
+    (or if it cannot handle the file) pandas falls back to its C engine.
+
+    Parameters
+    ----------
+    file_path : string
+        path of the file to read
+    sep : string
+        separetor, optional, default a tabulation
+    usecols : list of str, optional
+        names of the columns to read, by default all of them
+
+    Return
+    ------
+    df : pandas.DataFrame
+        content of the file, the first line is used as column names
+    '''
+    try:
+        return pd.read_csv(file_path, sep=sep, usecols=usecols, engine="pyarrow")
+    except (ImportError, ValueError):
+        # pyarrow is optional and stricter on ragged headers
+        return pd.read_csv(file_path, sep=sep, usecols=usecols)
+
+#==============================================================================================#
+
 def show_column_selection(app_instance, file_path, header, index_to_replace=None):
     '''
     Dialog window to select columns to load.
@@ -173,7 +404,7 @@ def show_column_selection(app_instance, file_path, header, index_to_replace=None
     # Instructions
     instructions = QLabel(
         "Select columns to load and name them. If the name is empty, the default will be used.\n"
-        "Scroll down to view data."
+        f"Scroll down to view data (only the first {PREVIEW_ROWS} rows are shown)."
     )
     instructions.setWordWrap(True)
     main_layout.addWidget(instructions)
@@ -184,17 +415,18 @@ def show_column_selection(app_instance, file_path, header, index_to_replace=None
 
     header_length = detect_header_length(file_path)
 
-    # Preview Data Table
-    if header_length > 0:
-        all_df = pd.read_csv(file_path, sep="\t").drop(list(range(header_length)))
-        
+    # Preview Data Table, the whole file is read only once the
+    # columns are chosen and only for the selected ones
+    if header_length >= 0:
+        all_df = pd.read_csv(
+            file_path, sep="\t", nrows=header_length + PREVIEW_ROWS
+        ).drop(list(range(header_length)))
+
     elif header_length == -1:
-        data     = np.loadtxt(file_path)
+        data     = np.loadtxt(file_path, max_rows=PREVIEW_ROWS, ndmin=2)
         _, n_col = data.shape
         col      = [f"col_{i}" for i in range(n_col)]
         all_df   = pd.DataFrame(data, columns=col)
-    else:
-        all_df = pd.read_csv(file_path, sep="\t")
 
     table = QTableWidget()
     table.setRowCount(len(all_df))
@@ -287,7 +519,7 @@ def show_column_selection(app_instance, file_path, header, index_to_replace=None
 
             if header_length >= 0:
                 df_header = pd.read_csv(file_path, sep="\t", nrows=header_length)
-                full_df   = pd.read_csv(file_path, sep="\t")
+                full_df   = read_data(file_path, usecols=list(dict.fromkeys(columns_to_load)) or None)
 
             elif header_length == -1:
                 df_header = header
@@ -302,6 +534,10 @@ def show_column_selection(app_instance, file_path, header, index_to_replace=None
             idx_name       = 0
             col_source_map = {}
 
+            # Header rows are skipped by slicing, the DataFrame constructor
+            # then makes the only copy of each column
+            rows = slice(max(header_length, 0), None)
+
             for i in range(len(header)):
                 if not selected_columns[i].isChecked():
                     continue
@@ -311,17 +547,14 @@ def show_column_selection(app_instance, file_path, header, index_to_replace=None
 
                 for k in range(n_copies):
                     new_name                 = column_names[idx_name]
-                    data_dict[new_name]      = full_df[original_col].values.copy()
+                    data_dict[new_name]      = full_df[original_col].values[rows]
                     idx_name                += 1
                     col_source_map[new_name] = original_col
 
-            df_data = pd.DataFrame(data_dict)
+            df_data = pd.DataFrame(data_dict, index=full_df.index[rows], copy=True)
             df_data.attrs["column_source_map"] = col_source_map  
             df_data.attrs["filename"] = os.path.basename(file_path)
 
-            if header_length >= 0 :
-                df_data = df_data.drop(list(range(header_length)))
-
             app_instance.logger.info(f"From: {file_path}, load: {columns_to_load}")
 
             if index_to_replace is not None:
@@ -391,15 +624,20 @@ def save_header(app_instance, header_df, df, file_path):
         path of the file to save
     '''
     try:
-        with open(file_path, "w", encoding='utf-8') as f:
-            # Write the names of the columns
-            f.write("\t".join(df.columns) + "\n")
-            
-            # Writes every row of the DataFrame, ignoring NaNs
-            if isinstance(header_df, pd.DataFrame):
-                for _, row in header_df.iterrows():
-                    line = "\t".join(row.astype(str).fillna("").replace("nan", "").values)
-                    f.write(line.strip() + "\n")
+        # The names of the columns
+        lines = ["\t".join(df.columns)]
+
+        # Every row of the DataFrame, ignoring NaNs, converted all at once
+        if isinstance(header_df, pd.DataFrame):
+            cells = header_df.astype(str).fillna("").replace("nan", "")
+            lines.extend(
+                "\t".join(row).strip()
+                for row in cells.itertuples(index=False, name=None)
+            )
+
+        # Built in memory and written with a single call
+        with open(file_path, "w", encoding='utf-8', buffering=1 << 20) as f:
+            f.write("\n".join(lines) + "\n")
         app_instance.logger.info(f"File saved successfully in: {file_path}")
 
     except Exception as e:
@@ -518,7 +756,8 @@ def save_to_file(df_idx, app_instance, parent_widget=None):
             parent_widget,
             "Save modified file",
             "",
-            "Text file (*.txt);;CSV (*.csv);;Tutti i file (*)"
+            "Text file (*.txt);;CSV (*.csv);;Tutti i file (*)",
+            options=FILE_DIALOG_OPTIONS
         )
         
         # ensure .txt extension
@@ -530,17 +769,67 @@ def save_to_file(df_idx, app_instance, parent_widget=None):
             QMessageBox.warning(parent_widget, "Canceled", "Operation cancelled.")
             return
 
+        # Nothing to write if this same content was already saved
+        # there and the file has not been touched since
+        digest     = _content_digest(df, header)
+        last_saved = _last_saved.get(id(dataframes[df_idx]))
+        if last_saved is not None and last_saved[1:3] == (file_path, digest):
+            stat = os.stat(file_path) if os.path.exists(file_path) else None
+            if stat is not None and (stat.st_mtime_ns, stat.st_size) == last_saved[3:]:
+                app_instance.logger.info(f"No changes since last save, {file_path} not rewritten")
+                QMessageBox.information(parent_widget, "Success", f"Data already saved in:\n{file_path}")
+                return
+
         save_header(app_instance, header, df, file_path)
-        # Save the data in the new file in text format
-        with open(file_path, "a", encoding='utf-8') as f:
+        # Save the data in the new file in text format, a block of rows
+        # at a time so the whole table is never formatted in memory
+        with open(file_path, "a", encoding='utf-8', newline="") as f:
+
+            df.to_csv(
+                f, sep="\t", header=False, index=False, na_rep="nan",
+                lineterminator="\n", chunksize=SAVE_CHUNK_ROWS
+            )
 
-            np.savetxt(f, np.array(df), delimiter="\t", fmt="%s")
+        stat = os.stat(file_path)
+        key  = id(dataframes[df_idx])
+        ref  = weakref.ref(dataframes[df_idx], lambda _, key=key: _last_saved.pop(key, None))
+        _last_saved[key] = (ref, file_path, digest, stat.st_mtime_ns, stat.st_size)
 
         QMessageBox.information(parent_widget, "Success", f"Data successfully saved in:\n{file_path}")
 
     except Exception as e:
         QMessageBox.critical(parent_widget, "Error", f"Error while saving:\n{e}")
 
+#==============================================================================================#
+
+def _content_digest(df, header):
+    '''
+    Hash of what save_to_file writes, computed without formatting the data.
+
+    Parameters
+    ----------
+    df : pandas dataframe
+        data to save, with the final column names
+    header : pandas dataframe or list
+        header of the file
+
+    Return
+    ------
+    digest : bytes
+        blake2b digest of columns, data and header
+    '''
+    h = hashlib.blake2b(digest_size=16)
+    h.update("\t".join(map(str, df.columns)).encode("utf-8"))
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+
+    if isinstance(header, pd.DataFrame):
+        h.update("\t".join(map(str, header.columns)).encode("utf-8"))
+        h.update(pd.util.hash_pandas_object(header, index=False).to_numpy().tobytes())
+    else:
+        h.update(repr(header).encode("utf-8"))
+
+    return h.digest()
+
 #==============================================================================================#
 # Function that create a copy of a given file                                                  #
 #==============================================================================================#
@@ -560,7 +849,8 @@ def duplicate_file(parent_widget=None):
         parent_widget,
         "Select the file to duplicate",
         "",
-        "Text Files (*.txt);;All Files (*)"
+        "Text Files (*.txt);;All Files (*)",
+        options=FILE_DIALOG_OPTIONS
     )
 
     if not file_path:
@@ -100,6 +100,7 @@ def norm_dialog(plot_instance, app_instance):
     # Checkbox cicli
     for label in cycles:
         cb = QCheckBox(label)
+        cb.setObjectName(f"cycle_{cycle_map[label]}")
         scroll_layout.addWidget(cb)
         cycle_checks[label] = cb
 
@@ -111,28 +112,9 @@ def norm_dialog(plot_instance, app_instance):
 
     # === BUtton apply ===
     def apply():
-        selected_cols      = []
-        selected_files_idx = []
-
         try:
-            for label, cb in cycle_checks.items():
-                if cb.isChecked():
-
-                    idx   = cycle_map[label]
-                    line1 = lines[idx * 2]
-                    line2 = lines[idx * 2 + 1]
-
-                    cols1 = getattr(line1, "_cols", None)
-                    cols2 = getattr(line2, "_cols", None)
-                    index = getattr(line1, "_file_index", None)
-
-                    if index is not None:
-                        selected_files_idx.append(index)
-
-                    if cols1:
-                        selected_cols.append(cols1[1]) # Y column of the first branch
-                    if cols2:
-                        selected_cols.append(cols2[1]) # Y column of the second branch
+            chosen = [cycle_map[label] for label, cb in cycle_checks.items() if cb.isChecked()]
+            selected_files_idx, selected_cols = pick_y_columns(lines, chosen)
 
         except Exception as e:
             QMessageBox.critical(dialog, "Error", f"Selection error:\n{e}")
@@ -154,6 +136,47 @@ def norm_dialog(plot_instance, app_instance):
 
     dialog.exec_()
 
+def pick_y_columns(lines, cycles):
+    '''
+    Collect the files and the Y columns of the chosen cycles.
+    Each cycle is made of two consecutive lines, one for each branch.
+
+    Parameters
+    ----------
+    lines : list
+        Plotted lines, already cleaned from grid and fit lines.
+    cycles : list
+        Indices of the chosen cycles.
+
+    Returns
+    -------
+    selected_files_idx : list
+        File index of each cycle, taken from its first branch.
+    selected_cols : list
+        Y columns of the two branches of each cycle.
+    '''
+
+    selected_cols      = []
+    selected_files_idx = []
+
+    for idx in cycles:
+        line1 = lines[idx * 2]
+        line2 = lines[idx * 2 + 1]
+
+        cols1 = getattr(line1, "_cols", None)
+        cols2 = getattr(line2, "_cols", None)
+        index = getattr(line1, "_file_index", None)
+
+        if index is not None:
+            selected_files_idx.append(index)
+
+        if cols1:
+            selected_cols.append(cols1[1]) # Y column of the first branch
+        if cols2:
+            selected_cols.append(cols2[1]) # Y column of the second branch
+
+    return selected_files_idx, selected_cols
+
 def apply_norm(plot_instance, app_instance, file_index, selected_cols):
     '''
     Cycle normalization function.
@@ -186,14 +209,12 @@ def apply_norm(plot_instance, app_instance, file_index, selected_cols):
             df = app_instance.dataframes[idx]
 
         
-            ell_up = df[y1].astype(float).values
-            ell_dw = df[y2].astype(float).values
+            # Both branches as one (N, 2) block, so every step is a single pass
+            block = df[[y1, y2]].to_numpy(dtype=float, copy=True)
 
             # Compute averages at start/end
-            aveup1 = np.mean(ell_up[:5])
-            aveup2 = np.mean(ell_up[-5:])
-            avedw1 = np.mean(ell_dw[:5])
-            avedw2 = np.mean(ell_dw[-5:])
+            aveup1, avedw1 = block[:5].mean(axis=0)
+            aveup2, avedw2 = block[-5:].mean(axis=0)
 
             # Branch direction correction
             if ((aveup1 > aveup2 and avedw1 > avedw2) or (aveup1 < aveup2 and avedw1 < avedw2)):
@@ -207,11 +228,10 @@ def apply_norm(plot_instance, app_instance, file_index, selected_cols):
             v_amplitude = abs(aveup1 - avedw1) * 0.5
 
             # Normalize
-            ell_up_normalized = (ell_up - v_shift) / v_amplitude
-            ell_dw_normalized = (ell_dw - v_shift) / v_amplitude
+            block -= v_shift
+            block /= v_amplitude
 
-            df[y1] = ell_up_normalized
-            df[y2] = ell_dw_normalized
+            df[[y1, y2]] = block
             logger.info(f"Normalization applied to {y1}.")
             logger.info(f"Normalization applied to {y2}.")
         
@@ -506,10 +526,10 @@ def close_loop_dialog(plot_instance, app_instance):
                 cols1 = l1._cols
                 cols2 = l2._cols
 
-                x1 = df[cols1[0]].astype(float).values
-                y1 = df[cols1[1]].astype(float).values
-                x2 = df[cols2[0]].astype(float).values
-                y2 = df[cols2[1]].astype(float).values
+                x1 = df[cols1[0]].to_numpy(dtype=float)
+                y1 = df[cols1[1]].to_numpy(dtype=float)
+                x2 = df[cols2[0]].to_numpy(dtype=float)
+                y2 = df[cols2[1]].to_numpy(dtype=float)
                
 
                 if use_global:
@@ -523,10 +543,8 @@ def close_loop_dialog(plot_instance, app_instance):
                     app_instance.logger.info(f"Loop closure applied to file {selected_file_idx + 1}, columns {cols1[1]} and {cols2[1]}.")
                     app_instance.logger.info(f"Closure anchored at field {field:.4f}, indices {i_up} (up) and {i_dw} (down).")
 
-                df[cols1[1]] = y1_new
-                df[cols2[1]] = y2_new
-
-                
+                # Write both branches back as one block, as in apply_norm
+                df[[cols1[1], cols2[1]]] = np.column_stack((y1_new, y2_new))
 
         plot_instance.plot()
 
@@ -616,10 +634,11 @@ def apply_loop_closure(ell_up, ell_dw, i_up=None, i_dw=None):
         Corrected decreasing branch.
     '''
     
-    ell_up = ell_up.copy()
-    ell_dw = ell_dw.copy()
+    ell_up = np.array(ell_up, dtype=float)
+    ell_dw = np.array(ell_dw, dtype=float)
 
     num = len(ell_up)
+    idx = np.arange(num)
 
     #=================================================
     # Local case: if the field value is within
@@ -637,11 +656,10 @@ def apply_loop_closure(ell_up, ell_dw, i_up=None, i_dw=None):
         else:
             slope = 0
 
-
-        for i in range(num):
-            correction = 0.5 * delta * (i - slope) / (i_up - slope)
-            ell_up[i] -= correction*sign
-            ell_dw[i] += correction*sign
+        # Linear profile, zero at the slope and 0.5*delta at the pivot
+        correction = sign * 0.5 * delta * (idx - slope) / (i_up - slope)
+        ell_up -= correction
+        ell_dw += correction
 
         return ell_up, ell_dw
 
@@ -653,28 +671,16 @@ def apply_loop_closure(ell_up, ell_dw, i_up=None, i_dw=None):
     dy_stop  = abs(ell_up[-1] - ell_dw[-1])
 
     if dy_start > dy_stop:
-        if ell_up[0] > ell_dw[0]:
-            for i in range(num):
-                delta = (0.5 * (num - 1 - i) * dy_start) / (num - 1)
-                ell_up[i] -= delta
-                ell_dw[i] += delta
-        else:
-            for i in range(num):
-                delta = (0.5 * (num - 1 - i) * dy_start) / (num - 1)
-                ell_up[i] += delta
-                ell_dw[i] -= delta
-
+        sign       = 1 if ell_up[0] > ell_dw[0] else -1
+        correction = (0.5 * (num - 1 - idx) * dy_start) / (num - 1)
     else:
-        if ell_up[-1] > ell_dw[-1]:
-            for i in range(num):
-                delta = (0.5 * i * dy_stop) / (num - 1)
-                ell_up[i] -= delta
-                ell_dw[i] += delta
-        else:
-            for i in range(num):
-                delta = (0.5 * i * dy_stop) / (num - 1)
-                ell_up[i] += delta
-                ell_dw[i] -= delta
+        sign       = 1 if ell_up[-1] > ell_dw[-1] else -1
+        correction = (0.5 * idx * dy_stop) / (num - 1)
+
+    # The whole ramp is applied at once to both branches
+    correction *= sign
+    ell_up -= correction
+    ell_dw += correction
 
     return ell_up, ell_dw
 
@@ -775,10 +781,15 @@ def apply_column_inversion(file_index, selected_columns, dataframes, logger, plo
             QMessageBox.warning(plot_instance, "Error", "Select at least one column.")
             return
 
-        for col in selected:
-            if col in df.columns:
-                df[col] = df[col].astype(float) * -1
-                logger.info(f"Reversing column {col} in file {file_index + 1}.")
+        # All the columns as one block, negated in place and written back once
+        cols = [col for col in selected if col in df.columns]
+        if cols:
+            block = df[cols].to_numpy(dtype=float, copy=True)
+            np.negative(block, out=block)
+            df[cols] = block
+
+        for col in cols:
+            logger.info(f"Reversing column {col} in file {file_index + 1}.")
 
         plot_instance.plot()
         QMessageBox.information(plot_instance, "Success",
@@ -22,7 +22,6 @@ everything that is done otherwise it is not possible to start
 the analysis. From here the calls to the other functions branch out.
 """
 
-from importlib import resources
 import matplotlib.pyplot as plt
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtWidgets import (
@@ -32,7 +31,6 @@ from PyQt5.QtWidgets import (
     QDialog, QInputDialog, QScrollArea, QDesktopWidget, QListWidgetItem,
     QTabWidget
 )
-from PyQt5.QtGui import QPixmap
 
 # Code for data management
 from hyloa.data.io import load_files
@@ -52,6 +50,7 @@ from hyloa.gui.worksheet import WorksheetWindow
 # Auxiliary code
 from hyloa.utils.logging_setup import start_logging
 from hyloa.utils.check_version import check_for_updates
+from hyloa.utils.icons import load_pixmap
 
 
 class MainApp(QMainWindow):
@@ -126,12 +125,7 @@ class MainApp(QMainWindow):
         logo_label = QLabel()
         logo_label.setAlignment(Qt.AlignCenter)
 
-        def load_icon():
-            with resources.path("hyloa.resources", "icon-5.png") as p:
-                pixmap = QPixmap(str(p))
-            return pixmap
-        
-        pixmap = load_icon()
+        pixmap = load_pixmap("icon-5.png")
 
         if pixmap.isNull():
             logo_label.setText("Logo not found")
@@ -346,8 +340,7 @@ class MainApp(QMainWindow):
             for i, df in enumerate(self.dataframes):
                 lines.append(f"=== File {i+1} ===")
                 lines.append(f"Columns ({len(df.columns)}):")
-                for col in df.columns:
-                    lines.append(f"  - {col}")
+                lines.extend(map("  - {}".format, df.columns))
                 lines.append("")  # empty line separator
 
             text_widget.setText("\n".join(lines))
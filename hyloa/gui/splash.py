@@ -0,0 +1,118 @@
+# This file is part of HYLOA - HYsteresis LOop Analyzer.
+# Copyright (C) 2024 Francesco Zeno Costanzo
+
+# HYLOA is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# HYLOA is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with HYLOA. If not, see <https://www.gnu.org/licenses/>.
+
+
+
+"""
+Splash screen shown while the main window is loading
+"""
+import time
+from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel, QProgressBar
+from PyQt5.QtCore import Qt, QTimer
+
+
+# Duration to show the splash screen at minimum
+MIN_SPLASH_TIME = 3.0  # Seconds
+# Refresh interval of the splash progress bar
+PROGRESS_INTERVAL = 33 # Milliseconds
+
+
+class Splash(QWidget):
+    '''
+    Splash screen with a logo and a progress bar.
+    '''
+    def __init__(self, pixmap, center=None, min_splash_time=MIN_SPLASH_TIME):
+        '''
+        Initialize the splash screen with a logo and a progress bar.
+        The progress bar is advanced by a timer according to the
+        elapsed time, and by the loading stages through set_progress,
+        until finish is called.
+
+        Parameters
+        ----------
+        pixmap : QPixmap
+            The logo to display on the splash screen.
+        center : QPoint, optional
+            Point where the splash is centered, by default the center
+            of the available geometry of the primary screen.
+        min_splash_time : float, optional
+            The minimum duration to show the splash screen (seconds).
+        '''
+        super().__init__(
+            flags=Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint
+        )
+
+        self.setAttribute(Qt.WA_TranslucentBackground)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+
+        # Logo
+        self.logo = QLabel()
+        self.logo.setPixmap(pixmap)
+        self.logo.setAlignment(Qt.AlignCenter)
+
+        # Progress Bar
+        self.progress = QProgressBar()
+        self.progress.setRange(0, 100)
+        self.progress.setValue(0)
+        self.progress.setTextVisible(True)
+        self.progress.setFormat("%p%")
+
+        layout.addWidget(self.logo)
+        layout.addWidget(self.progress)
+
+        if center is None:
+            center = QApplication.primaryScreen().availableGeometry().center()
+
+        self.adjustSize()
+        self.move(center - self.rect().center())
+
+        # Progress driven by elapsed time
+        self.start_time      = time.monotonic()
+        self.min_splash_time = min_splash_time
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._tick)
+        self._timer.start(PROGRESS_INTERVAL)
+
+    def _tick(self):
+        '''
+        Advance the progress bar according to the elapsed time.
+        The bar stops at 95% until the loading is finished and never
+        goes back from a loading stage already reached.
+        '''
+        elapsed = time.monotonic() - self.start_time
+        value   = min(95, int(elapsed / self.min_splash_time * 100))
+        self.set_progress(max(self.progress.value(), value))
+
+    def finish(self):
+        '''
+        Stop the progress timer and fill the progress bar.
+        '''
+        self._timer.stop()
+        self.set_progress(100)
+
+    def set_progress(self, value):
+        '''
+        Update the progress bar value.
+        
+        Parameters
+        ----------
+        value : int
+            The new value for the progress bar (0-100).
+        '''
+        self.progress.setValue(value)
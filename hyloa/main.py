@@ -21,126 +21,92 @@ Entry point for HYLOA application.
 import os
 import sys
 import time 
-from importlib import resources
-from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel, QProgressBar
-from PyQt5.QtGui import QPixmap
-from PyQt5.QtCore import Qt, QTimer
 
+# Qt is imported inside main, after the options that do not need it
 
-# Duration to show the splash screen at minimum
-MIN_SPLASH_TIME = 3.0  # Seconds
+# Help message for the command line options
+USAGE = """usage: hyloa [--no-splash] [-V | --version] [-h | --help]
 
-# High DPI scaling attributes for better appearance on high-resolution displays
-os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
-QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+Start the HYLOA graphical interface.
 
-
-class Splash(QWidget):
-    '''
-    Splash screen with a logo and a progress bar.
-    '''
-    def __init__(self, pixmap):
-        '''
-        Initialize the splash screen with a logo and a progress bar.
-
-        Parameters
-        ----------
-        pixmap : QPixmap
-            The logo to display on the splash screen.
-        '''
-        super().__init__(
-            flags=Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint
-        )
-
-        self.setAttribute(Qt.WA_TranslucentBackground)
-
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(20, 20, 20, 20)
-
-        # Logo
-        self.logo = QLabel()
-        self.logo.setPixmap(pixmap)
-        self.logo.setAlignment(Qt.AlignCenter)
-
-        # Progress Bar
-        self.progress = QProgressBar()
-        self.progress.setRange(0, 100)
-        self.progress.setValue(0)
-        self.progress.setTextVisible(True)
-        self.progress.setFormat("%p%")
-
-        layout.addWidget(self.logo)
-        layout.addWidget(self.progress)
-
-        self.adjustSize()
-        self.move(
-            self.screen().geometry().center() - self.rect().center()
-        )
-
-    def set_progress(self, value):
-        '''
-        Update the progress bar value.
-        
-        Parameters
-        ----------
-        value : int
-            The new value for the progress bar (0-100).
-        '''
-        self.progress.setValue(value)
-
-
-def compute_remaining_time(start_time, min_splash_time):
-    '''
-    Compute the remaining time to show the splash screen
-
-    Parameters
-    ----------
-    start_time : float
-        The time when the splash screen was shown (monotonic).
-    min_splash_time : float
-        The minimum duration to show the splash screen (seconds).
-    Returns
-    -------
-    int
-        Remaining time in milliseconds to show the splash screen.
-    '''
-    elapsed = time.monotonic() - start_time
-    return max(0, int((min_splash_time - elapsed) * 1000))
+options:
+  --no-splash    open the main window directly, without the splash screen
+  -V, --version  print the installed version and exit
+  -h, --help     show this message and exit"""
 
 
 def main():
     '''
     Main entry point for the HYLOA application.
     '''
-    start_time = time.monotonic()
+    args = sys.argv[1:]
+
+    # Options that do not need the interface
+    if "-V" in args or "--version" in args:
+        import hyloa
+        print(f"hyloa {hyloa.__version__}")
+        return
+    if "-h" in args or "--help" in args:
+        print(USAGE)
+        return
+
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import Qt, QTimer
+
+    # High DPI scaling attributes for better appearance on high-resolution displays,
+    # they must be set before the QApplication is created
+    os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+
     app = QApplication(sys.argv)
 
-    # Load splash screen resources
-    with resources.path("hyloa.resources", "icon-6.png") as p:
-        pixmap = QPixmap(str(p))
+    if "--no-splash" in args:
+        from hyloa.gui.main_window import MainApp
+        window = MainApp()
+        window.show()
+        sys.exit(app.exec_())
+
+    from hyloa.utils.icons import load_pixmap
+    from hyloa.gui.splash import Splash, MIN_SPLASH_TIME
 
-    splash = Splash(pixmap)
+    # Load splash screen resources, decoded once and kept in the pixmap cache
+    pixmap = load_pixmap("icon-6.png")
+
+    center = app.primaryScreen().availableGeometry().center()
+    splash = Splash(pixmap, center)
     splash.show()
-    splash.set_progress(20)
+    # Paint the splash now, the loading below keeps the event loop busy
+    splash.repaint()
     app.processEvents()
 
-    # Import main window (heavy part of the loading)
-    from hyloa.gui.main_window import MainApp
-    splash.set_progress(60)
-    app.processEvents()
-    window = MainApp()
-   
-    remaining = compute_remaining_time(start_time, MIN_SPLASH_TIME)
+    # Kept here so the main window lives as long as the event loop
+    window = None
 
-    def finish():
-        splash.set_progress(100)
+    def load():
+        nonlocal window
+        # Import main window (heavy part of the loading)
+        from hyloa.gui.main_window import MainApp
+        splash.set_progress(max(splash.progress.value(), 60))
         app.processEvents()
-        window.show()
-        splash.close()
 
-    QTimer.singleShot(remaining, finish)
-    
+        window = MainApp()
+        splash.set_progress(max(splash.progress.value(), 90))
+        app.processEvents()
+
+        # Remaining time in milliseconds to show the splash screen
+        elapsed   = time.monotonic() - splash.start_time
+        remaining = max(0, int((MIN_SPLASH_TIME - elapsed) * 1000))
+
+        def finish():
+            splash.finish()
+            window.show()
+            splash.close()
+
+        QTimer.singleShot(remaining, finish)
+
+    # Load once the event loop is running
+    QTimer.singleShot(0, load)
 
     sys.exit(app.exec_())
 
@@ -19,16 +19,33 @@ Code connected to the button to check if the installed version is
 the last version aviable on GitHub
 """
 import re
+import time
 import requests
-from packaging import version
-from PyQt5.QtWidgets import QMessageBox 
+from PyQt5.QtWidgets import QMessageBox
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 
 import hyloa
 
+# (connect, read) timeout in seconds for the request to GitHub
+REQUEST_TIMEOUT = (3.05, 5)
+# Time in seconds after which the cached remote version is fetched again
+CACHE_TTL = 3600
+
+# Line of __init__.py that defines the version
+_VERSION_RE = re.compile(r'__version__\s*=\s*["\']([\d\.]+)["\']')
+
+# Cache of the remote version: url -> (monotonic timestamp, version)
+_version_cache = {}
+
+# Workers still running, kept alive until their result is delivered
+_active_workers = set()
+
 def get_latest_version_from_init():
     '''
     Fetches the latest version of the hyloa package
     from its __init__.py file on GitHub.
+    The result is cached for CACHE_TTL seconds, so repeated
+    checks in the same session do not hit the network again.
 
     Returns
     -------
@@ -37,13 +54,26 @@ def get_latest_version_from_init():
     '''
     repo = "Francesco-Zeno-Costanzo/hyloa/main/hyloa/__init__.py"
     url  = f"https://raw.githubusercontent.com/{repo}"
-    
-    response = requests.get(url)
-    if response.status_code == 200:
-        # Extract the version using regex
-        match = re.search(r'__version__\s*=\s*["\']([\d\.]+)["\']', response.text)
-        if match:
-            return match.group(1)
+
+    cached = _version_cache.get(url)
+    if cached is not None and time.monotonic() - cached[0] <= CACHE_TTL:
+        return cached[1]
+
+    try:
+        # Stream the body, the connection is closed as soon as the version is found
+        with requests.get(url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+            if response.status_code != 200:
+                return None
+
+            # Extract the version using regex, stopping at the first match
+            for line in response.iter_lines():
+                match = _VERSION_RE.search(line.decode("utf-8", errors="replace"))
+                if match:
+                    _version_cache[url] = (time.monotonic(), match.group(1))
+                    return match.group(1)
+    except requests.RequestException:
+        return None
+
     return None
 
 def get_local_version():
@@ -52,6 +82,18 @@ def get_local_version():
     return hyloa.__version__
 
 
+def _version_tuple(ver):
+    '''
+    Converts a dotted version string like "1.13.2" in a tuple of int,
+    without trailing zeros so that "1.13" and "1.13.0" compare equal.
+    Raises ValueError if some part is not an integer.
+    '''
+    parts = [int(part) for part in ver.split(".")]
+    while parts and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+
 def is_update_available(local_ver, remote_ver):
     '''
     Checks if a newer version of the hyloa package is available.
@@ -68,16 +110,49 @@ def is_update_available(local_ver, remote_ver):
     bool
         True if a newer version is available, False otherwise.
     '''
-    return version.parse(remote_ver) > version.parse(local_ver)
+    try:
+        return _version_tuple(remote_ver) > _version_tuple(local_ver)
+    except ValueError:
+        # Not a plain dotted version (e.g. "2.0.0rc1"), let packaging handle it
+        from packaging import version
+        return version.parse(remote_ver) > version.parse(local_ver)
 
 
-def check_for_updates():
+class UpdateCheckSignals(QObject):
     '''
-    Checks for updates to the hyloa package by comparing the local version
-    with the latest version available on GitHub.
+    Signals emitted by UpdateCheckWorker.
+    The finished signal carries the remote version string, or None
+    if it could not be retrieved.
     '''
-    local_ver  = get_local_version()
-    remote_ver = get_latest_version_from_init()
+    finished = pyqtSignal(object)
+
+
+class UpdateCheckWorker(QRunnable):
+    '''
+    Runnable that fetches the latest version from GitHub
+    on a thread of the global QThreadPool.
+    '''
+    def __init__(self):
+        super().__init__()
+        self.signals = UpdateCheckSignals()
+
+    def run(self):
+        '''
+        Perform the network request and emit the result.
+        '''
+        self.signals.finished.emit(get_latest_version_from_init())
+
+
+def show_update_result(remote_ver):
+    '''
+    Informs the user about the result of the update check.
+
+    Parameters
+    ----------
+    remote_ver : str or None
+        The remote version of the hyloa package, None if unavailable.
+    '''
+    local_ver = get_local_version()
 
     if remote_ver is None:
         QMessageBox.critical(None, "Error", "Unable to check for updates. Please check your internet connection")
@@ -91,3 +166,21 @@ def check_for_updates():
         """
     else:
         QMessageBox.information(None, "Already update", f"You are already using the latest version ({local_ver}).")
+
+
+def check_for_updates():
+    '''
+    Checks for updates to the hyloa package by comparing the local version
+    with the latest version available on GitHub.
+    The request runs on a worker thread so the GUI stays responsive,
+    the result is shown once it is available.
+    '''
+    worker = UpdateCheckWorker()
+    _active_workers.add(worker)
+
+    def on_finished(remote_ver):
+        _active_workers.discard(worker)
+        show_update_result(remote_ver)
+
+    worker.signals.finished.connect(on_finished)
+    QThreadPool.globalInstance().start(worker)
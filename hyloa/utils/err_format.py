@@ -17,9 +17,24 @@
 """
 Code to ensure correct print format for error
 """
-import numpy as np
+import math
+from functools import lru_cache
 
+# Powers of ten for the exponents met in practice, 10**k is _POW10[k + 30]
+_POW10 = tuple(10.0**k for k in range(-30, 31))
 
+
+def _p10(k):
+    '''
+    Returns 10**k, using the lookup table when k is in range.
+    '''
+    if -30 <= k <= 30:
+        return _POW10[k + 30]
+    return 10.0**k
+
+
+# Pure function of its arguments; typed=True keeps 1 and 1.0 apart
+@lru_cache(maxsize=1024, typed=True)
 def format_value_error(val, err):
     '''
     A function that returns the formatting of the measurement
@@ -40,6 +55,11 @@ def format_value_error(val, err):
     ------
     string
 
+    Raises
+    ------
+    ValueError
+        If err is not strictly positive.
+
     Examples
     --------
     >>> print(format_value_error(1.234598, 0.01631)
@@ -51,68 +71,44 @@ def format_value_error(val, err):
     >>> print(format_value_error(5.6e-05, 1.2e-06)
     5.6(1)e-5
     '''
-    
-    # Division between mantissa and exponent for error
-    exp  = int(np.log10(err))
-    mant = err / 10**exp
+    # log10 is undefined for non positive errors
+    if not err > 0:
+        raise ValueError(f"The error must be strictly positive, got {err}")
+
+    # Exponent of the error, floor gives it directly for any magnitude
+    exp = math.floor(math.log10(err))
 
     # Scientific notation for error bigger than 1e3 and smoller than 1e-3
-    if abs(exp) >= 3:
+    if err <= 1e-3 or err >= 1e3:
         # Division between mantissa and exponent for central value
-        exp_val  = int(np.log10(abs(val)) if val != 0 else 0)
-        scale    = 10**exp_val
+        exp_val  = math.floor(math.log10(abs(val))) if val != 0 else 0
+        scale    = _p10(exp_val)
         mant_val = val / scale
 
-        # Ensures correct formatting
-        if mant_val < 1:
-            exp_val  -= 1
-            scale    /= 10
-            mant_val *= 10   
-
-        elif mant_val >= 10:
-            exp_val  += 1
-            scale    *= 10
-            mant_val /= 10
-
         # Sacle the error
         err_scaled = err / scale
-        exp_err    = int(np.log10(err_scaled))
-        mant_err   = err_scaled / 10**(exp_err)
-
-        # Ensures correct formatting
-        if mant_err < 1:
-            exp_err  -= 1
-            # Update mantissa will be correct but not necessary
-        elif mant_err >= 10:
-            exp_err  += 1
+        exp_err    = math.floor(math.log10(err_scaled))
 
         # Number of significant digits to display
         sig_dig  = 1
         # Dacimal for rounding to sig_dig digits
         decimals = max(0, -exp_err -1 + sig_dig)
 
-        err_int  = int(round(err_scaled * 10**decimals))
-        mant_val = round(mant_val, decimals)
+        # Errors are positive, so adding 0.5 and truncating rounds them.
+        # The value is rounded by the format itself.
+        err_int  = int(err_scaled * _p10(decimals) + 0.5)
         val_str  = f"{mant_val:.{decimals}f}"
 
         return f"{val_str}({err_int})e{exp_val}"
 
-    # Ensures correct formatting
-    if mant < 1.0:
-        exp  -= 1 
-        # Update mantissa will be correct but not necessary
-    elif mant >= 10.0:
-        exp  += 1
-
     # Number of significant digits to display
     sig_dig = 1
     # Dacimal for rounding to sig_dig digits
     decimals = max(0, -exp - 1 + sig_dig)
 
     err_rounded = round(err, decimals)
-    val_rounded = round(val, decimals)
 
-    err_int = int(round(err_rounded * 10**decimals))
-    val_str = f"{val_rounded:.{decimals}f}"
+    err_int = int(err_rounded * _p10(decimals) + 0.5)
+    val_str = f"{val:.{decimals}f}"
 
     return f"{val_str}({err_int})"
\ No newline at end of file
@@ -0,0 +1,54 @@
+# This file is part of HYLOA - HYsteresis LOop Analyzer.
+# Copyright (C) 2024 Francesco Zeno Costanzo
+
+# HYLOA is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# HYLOA is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with HYLOA. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Code to load the images shipped in hyloa/resources
+"""
+from importlib import resources
+from PyQt5.QtGui import QPixmap, QPixmapCache
+
+
+def load_pixmap(name):
+    '''
+    Loads an image from hyloa/resources as a QPixmap.
+    The image is decoded only the first time, then it is taken from
+    the QPixmapCache, so every window can ask for it freely.
+    A QApplication must already exist.
+
+    Parameters
+    ----------
+    name : str
+        File name of the image, e.g. "icon-6.png".
+
+    Returns
+    -------
+    QPixmap
+        The loaded image, null if it could not be read.
+    '''
+    key    = f"hyloa:{name}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None:
+        return pixmap
+
+    pixmap = QPixmap()
+    try:
+        data = resources.files("hyloa.resources").joinpath(name).read_bytes()
+    except OSError:
+        return pixmap
+
+    if pixmap.loadFromData(data):
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
@@ -18,31 +18,68 @@
 """
 Code for logger setup
 """
+import queue
+import atexit
 import logging
+import logging.handlers
 from PyQt5.QtWidgets import QFileDialog, QMessageBox
 
+# Listener that writes the queued records on the log file
+_listener = None
+
+
+def stop_logging():
+    '''
+    Stops the listener thread, writing all the queued records
+    on the log file and closing it.
+    '''
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+# Ensure nothing is lost at shutdown
+atexit.register(stop_logging)
+
 
 def setup_logging(log_file):
     '''
     Configures logging to the specified file.
+    The root logger only puts the records on a queue, the file
+    is written by a QueueListener on a separate thread, so logging
+    from the GUI never waits on disk writes.
 
     Parameters
     ----------
     log_file : str
         Path to the log file.
     '''
+    global _listener
+
     try:
         # Remove any existing handlers
         for handler in logging.root.handlers[:]:
             logging.root.removeHandler(handler)
+        stop_logging()
 
-        logging.basicConfig(
-            filename=log_file,
-            level=logging.INFO,
-            encoding="utf-8",
-            format="%(asctime)s -  %(name)s - %(levelname)s - %(message)s",
+        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler.setFormatter(logging.Formatter(
+            fmt="%(asctime)s -  %(name)s - %(levelname)s - %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S"
+        ))
+
+        log_queue = queue.Queue(-1)
+        _listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
         )
+        _listener.start()
+
+        logging.root.setLevel(logging.INFO)
+        logging.root.addHandler(logging.handlers.QueueHandler(log_queue))
+
         logging.info("Start of log session.")
         logging.info(f"Logging configured: write on {log_file}")
     except Exception as e:
@@ -0,0 +1,78 @@
+# This file is part of HYLOA - HYsteresis LOop Analyzer.
+# Copyright (C) 2024 Francesco Zeno Costanzo
+
+# HYLOA is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# HYLOA is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with HYLOA. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+test for the update check
+"""
+from unittest.mock import MagicMock, patch
+
+import requests
+
+import hyloa.utils.check_version as cv
+
+
+def fake_response(text, status_code=200):
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.status_code = status_code
+    response.iter_lines.return_value = [line.encode() for line in text.splitlines()]
+    return response
+
+
+@patch("hyloa.utils.check_version.requests.get")
+def test_latest_version_is_cached(mock_get, monkeypatch):
+    monkeypatch.setattr(cv, "_version_cache", {})
+    mock_get.return_value = fake_response('"""Doc"""\n__version__ = "9.9.9"\n')
+
+    assert cv.get_latest_version_from_init() == "9.9.9"
+    assert cv.get_latest_version_from_init() == "9.9.9"
+
+    # Second call is served from the cache
+    mock_get.assert_called_once()
+    assert mock_get.call_args.kwargs["timeout"] == cv.REQUEST_TIMEOUT
+    assert mock_get.call_args.kwargs["stream"]
+
+
+@patch("hyloa.utils.check_version.requests.get")
+def test_latest_version_network_error(mock_get, monkeypatch):
+    monkeypatch.setattr(cv, "_version_cache", {})
+    mock_get.side_effect = requests.ConnectionError
+
+    assert cv.get_latest_version_from_init() is None
+    assert cv._version_cache == {}
+
+
+def test_is_update_available():
+    assert cv.is_update_available("1.2.0", "1.10.0")
+    assert not cv.is_update_available("1.10.0", "1.10.0")
+    assert not cv.is_update_available("2.0.0", "1.10.0")
+    assert not cv.is_update_available("1.10.0", "1.10")
+
+
+@patch("hyloa.utils.check_version.QMessageBox")
+@patch("hyloa.utils.check_version.get_latest_version_from_init", return_value="999.0.0")
+def test_check_for_updates_runs_in_background(mock_latest, mock_box, qtbot):
+    cv.check_for_updates()
+
+    qtbot.waitUntil(lambda: mock_box.information.called, timeout=2000)
+    assert "999.0.0" in mock_box.information.call_args.args[2]
+    assert not cv._active_workers
+
+
+def test_is_update_available_pre_release():
+    # Non numeric versions fall back to packaging
+    assert cv.is_update_available("1.13.2", "1.14.0rc1")
+    assert not cv.is_update_available("1.14.0", "1.14.0rc1")
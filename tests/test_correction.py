@@ -1,12 +1,22 @@
 import pytest
-from unittest.mock import MagicMock, patch
+import numpy as np
+from unittest.mock import MagicMock
 
-from hyloa.data.correction import *
+from hyloa.data.correction import change_ps, flip, flip_data, apply_shift
+# Resolved once: the error tests patch its critical method
+from hyloa.data.correction import QMessageBox
 
 #==================================================================#
 # Auxiliar function for mock all inputs                            #
 #==================================================================#
 
+@pytest.fixture(autouse=True)
+def mock_msgbox(monkeypatch):
+    # No test may open a real message box, the error tests assert on it
+    critical = MagicMock()
+    monkeypatch.setattr(QMessageBox, "critical", critical)
+    return critical
+
 @pytest.fixture
 def mock_window():
     return MagicMock()
@@ -32,6 +42,12 @@ def mock_double_branch():
     combo.currentText.return_value = "No"
     return combo
 
+@pytest.fixture
+def mock_data_sel():
+    combo = MagicMock()
+    combo.currentText.return_value = "Corrected"
+    return combo
+
 @pytest.fixture
 def mock_lineedit():
     le = MagicMock()
@@ -42,9 +58,10 @@ def mock_lineedit():
 def mock_fit_data():
     return MagicMock()
 
-@pytest.fixture
-def base_plot_state():
-    return {
+@pytest.fixture(scope="session")
+def _plot_state_template():
+    # Built once, arrays are read only so no test can alter the template
+    template = {
         "done_corr": True,
         "done_spl3": True,
         "x_up": np.array([1., 2.]),
@@ -64,61 +81,50 @@ def base_plot_state():
         "s_data_up": ([], []),
         "s_data_dw": ([], []),
     }
+    for value in template.values():
+        if isinstance(value, np.ndarray):
+            value.setflags(write=False)
+    return template
+
+@pytest.fixture
+def base_plot_state(_plot_state_template):
+    return {
+        k: (v.copy() if isinstance(v, np.ndarray) else v)
+        for k, v in _plot_state_template.items()
+    }
 
 #==================================================================#
 # Tests                                                            #
 #==================================================================#
 
-def test_change_ps_cp(base_plot_state, mock_window, mock_draw_plot):
-    change_ps(
-        plot_state=base_plot_state,
-        window=mock_window,
-        draw_plot=mock_draw_plot,
-        mode="cp"
-    )
-
-    assert base_plot_state["done_corr"] is False
-    assert base_plot_state["done_spl3"] is False
-
-    assert base_plot_state["x_up_corr"] is None
-    assert base_plot_state["y_up_corr"] is None
-    assert base_plot_state["x_dw_corr"] is None
-    assert base_plot_state["y_dw_corr"] is None
-
-    assert base_plot_state["spline_up"] is None
-    assert base_plot_state["spline_dw"] is None
-
-    mock_draw_plot.assert_called_once()
-
-def test_change_ps_od(base_plot_state, mock_window, mock_draw_plot):
-    change_ps(
-        plot_state=base_plot_state,
-        window=mock_window,
-        draw_plot=mock_draw_plot,
-        mode="od"
-    )
-
-    assert base_plot_state["x_up"] is None
-    assert base_plot_state["y_up"] is None
-    assert base_plot_state["x_dw"] is None
-    assert base_plot_state["y_dw"] is None
-
-    mock_draw_plot.assert_called_once()
-
-def test_change_ps_sym(base_plot_state, mock_window, mock_draw_plot):
+@pytest.mark.parametrize("mode, expected", [
+    ("cp", {
+        "done_corr": False, "done_spl3": False,
+        "x_up_corr": None, "y_up_corr": None,
+        "x_dw_corr": None, "y_dw_corr": None,
+        "spline_up": None, "spline_dw": None,
+    }),
+    ("od", {
+        "x_up": None, "y_up": None,
+        "x_dw": None, "y_dw": None,
+    }),
+    ("sym", {
+        "s_data_up": None, "s_data_dw": None,
+    }),
+])
+def test_change_ps(mode, expected, base_plot_state, mock_window, mock_draw_plot):
     change_ps(
         plot_state=base_plot_state,
         window=mock_window,
         draw_plot=mock_draw_plot,
-        mode="sym"
+        mode=mode
     )
 
-    assert base_plot_state["s_data_up"] is None
-    assert base_plot_state["s_data_dw"] is None
+    for key, value in expected.items():
+        assert base_plot_state[key] is value, key
 
     mock_draw_plot.assert_called_once()
 
-@patch("hyloa.data.correction.QMessageBox.critical")
 def test_change_ps_exception(
     mock_msgbox,
     mock_window,
@@ -144,30 +150,19 @@ def test_flip_from_false_to_true(base_plot_state, mock_window, mock_draw_plot):
     assert base_plot_state["flipped"] is True
     mock_draw_plot.assert_called_once()
 
-from unittest.mock import patch
-
-@patch("hyloa.data.correction.QMessageBox.critical")
 def test_flip_exception(mock_msgbox, mock_window, mock_draw_plot):
-    plot_state = None  # TypeError
-
-    flip(base_plot_state, mock_window, mock_draw_plot)
-
+    # None is not subscriptable: TypeError
+    flip(None, mock_window, mock_draw_plot)
 
     mock_msgbox.assert_called_once()
     mock_draw_plot.assert_not_called()
 
-from unittest.mock import patch
-
-@patch("hyloa.data.correction.QMessageBox.critical")
 def test_flip_data_no_corrected_data(
-    mock_msgbox, mock_combo, mock_double_branch,
+    mock_msgbox, mock_combo, mock_double_branch, mock_data_sel,
     base_plot_state, mock_window, mock_logger, mock_draw_plot):
 
     base_plot_state["x_up_corr"] = None
 
-    mock_data_sel = MagicMock()
-    mock_data_sel.currentText.return_value = "Corrected"
-
     flip_data(
         mock_combo, mock_combo, mock_combo, mock_combo, mock_combo, mock_data_sel,
         mock_double_branch, base_plot_state, mock_window, mock_logger,
@@ -178,7 +173,7 @@ def test_flip_data_no_corrected_data(
     mock_draw_plot.assert_not_called()
 
 def test_flip_data_no_action(
-    mock_combo, mock_double_branch, base_plot_state,
+    mock_combo, mock_double_branch, mock_data_sel, base_plot_state,
     mock_window, mock_logger, mock_draw_plot):
 
     mock_double_branch.currentText.return_value = "No"
@@ -186,20 +181,17 @@ def test_flip_data_no_action(
     # Original State
     x_up_orig = base_plot_state["x_up_corr"].copy()
 
-    mock_data_sel = MagicMock()
-    mock_data_sel.currentText.return_value = "Corrected"
-
     flip_data(
         mock_combo, mock_combo, mock_combo, mock_combo, mock_combo, mock_data_sel,
         mock_double_branch, base_plot_state, mock_window, mock_logger,
         mock_draw_plot
     )
 
-    assert (base_plot_state["x_up_corr"] == x_up_orig).all()
+    assert np.array_equal(base_plot_state["x_up_corr"], x_up_orig)
     mock_draw_plot.assert_not_called()
 
 def test_flip_data_duplicate_up_branch(
-    mock_combo, mock_double_branch, base_plot_state,
+    mock_combo, mock_double_branch, mock_data_sel, base_plot_state,
       mock_window, mock_logger, mock_draw_plot):
     
     mock_double_branch.currentText.return_value = "Up"
@@ -208,35 +200,25 @@ def test_flip_data_duplicate_up_branch(
     y_up = base_plot_state["y_up_corr"].copy()
     e_up = base_plot_state["e_up"].copy()
 
-    mock_data_sel = MagicMock()
-    mock_data_sel.currentText.return_value = "Corrected"
-
     flip_data(
         mock_combo, mock_combo, mock_combo, mock_combo, mock_combo, mock_data_sel,
         mock_double_branch, base_plot_state, mock_window, mock_logger,
         mock_draw_plot
     )
 
-    assert (base_plot_state["x_dw_corr"] == -x_up[::-1]).all()
-    assert (base_plot_state["y_dw_corr"] == -y_up[::-1]).all()
-    assert (base_plot_state["e_dw"] == e_up[::-1]).all()
+    assert np.array_equal(base_plot_state["x_dw_corr"], -x_up[::-1])
+    assert np.array_equal(base_plot_state["y_dw_corr"], -y_up[::-1])
+    assert np.array_equal(base_plot_state["e_dw"], e_up[::-1])
 
     mock_draw_plot.assert_called_once()
     mock_logger.info.assert_called_once()
 
-def test_apply_shift_ok(mock_lineedit,base_plot_state,mock_window,mock_fit_data):
+def test_apply_shift_ok(mock_lineedit, mock_data_sel, base_plot_state,
+                        mock_window, mock_logger, mock_fit_data):
     
     x_up_orig = base_plot_state["x_up_corr"].copy()
     x_dw_orig = base_plot_state["x_dw_corr"].copy()
 
-    save_file_combo = MagicMock()
-    save_file_combo.currentIndex.return_value = 0
-
-    mock_data_sel = MagicMock()
-    mock_data_sel.currentText.return_value = "Corrected"
-
-    logger = MagicMock()
-
     apply_shift(
         mock_data_sel,
         mock_lineedit,
@@ -244,30 +226,20 @@ def test_apply_shift_ok(mock_lineedit,base_plot_state,mock_window,mock_fit_data)
         mock_window,
         mock_fit_data,
         args=("a", "b"),
-        logger=logger
+        logger=mock_logger
     )
 
-    assert (base_plot_state["x_up_corr"] == x_up_orig - 1.5).all()
-    assert (base_plot_state["x_dw_corr"] == x_dw_orig - 1.5).all()
+    assert np.array_equal(base_plot_state["x_up_corr"], x_up_orig - 1.5)
+    assert np.array_equal(base_plot_state["x_dw_corr"], x_dw_orig - 1.5)
 
     mock_fit_data.assert_called_once_with(*("a", "b"))
 
-from unittest.mock import patch
-
-@patch("hyloa.data.correction.QMessageBox.critical")
 def test_apply_shift_invalid_value(
-    mock_msgbox, mock_lineedit, base_plot_state, mock_window, mock_fit_data):
+    mock_msgbox, mock_lineedit, mock_data_sel, base_plot_state,
+    mock_window, mock_logger, mock_fit_data):
 
     mock_lineedit.text.return_value = "abc"
 
-    save_file_combo = MagicMock()
-    save_file_combo.currentIndex.return_value 
-
-    mock_data_sel = MagicMock()
-    mock_data_sel.currentText.return_value = "Corrected"
-
-    logger = MagicMock()
-
     apply_shift(
         mock_data_sel,
         mock_lineedit,
@@ -275,14 +247,14 @@ def test_apply_shift_invalid_value(
         mock_window,
         mock_fit_data,
         args=("a", "b"),
-        logger=logger
+        logger=mock_logger
     )
 
     mock_msgbox.assert_called_once()
     mock_fit_data.assert_not_called()
 
-@patch("hyloa.data.correction.QMessageBox.critical")
-def test_apply_shift_fit_raises(mock_msgbox, mock_lineedit, base_plot_state, mock_window):
+def test_apply_shift_fit_raises(mock_msgbox, mock_lineedit, mock_data_sel,
+                                base_plot_state, mock_window, mock_logger):
 
     x_up_orig = base_plot_state["x_up_corr"].copy()
     x_dw_orig = base_plot_state["x_dw_corr"].copy()
@@ -290,14 +262,6 @@ def test_apply_shift_fit_raises(mock_msgbox, mock_lineedit, base_plot_state, moc
     def failing_fit(*args):
         raise RuntimeError("fit failed")
 
-    save_file_combo = MagicMock()
-    save_file_combo.currentIndex.return_value 
-
-    mock_data_sel = MagicMock()
-    mock_data_sel.currentText.return_value = "Corrected"
-
-    logger = MagicMock()
-
     apply_shift(
         mock_data_sel,
         mock_lineedit,
@@ -305,11 +269,11 @@ def test_apply_shift_fit_raises(mock_msgbox, mock_lineedit, base_plot_state, moc
         mock_window,
         failing_fit,
         args=("a", "b"),
-        logger=logger
+        logger=mock_logger
     )
 
-    assert (base_plot_state["x_up_corr"] == x_up_orig).all()
-    assert (base_plot_state["x_dw_corr"] == x_dw_orig).all()
+    assert np.array_equal(base_plot_state["x_up_corr"], x_up_orig)
+    assert np.array_equal(base_plot_state["x_dw_corr"], x_dw_orig)
 
     mock_msgbox.assert_called_once()
 
@@ -19,9 +19,22 @@ test for IO
 """
 
 import pytest
-from unittest.mock import patch, mock_open, MagicMock
-
-from hyloa.data.io import *
+import numpy as np
+import pandas as pd
+from unittest.mock import patch, MagicMock
+from PyQt5.QtWidgets import (
+    QApplication, QMessageBox, QCheckBox, QPushButton, QDialog, QComboBox, QListWidget
+)
+
+import hyloa.data.io as io_module
+from hyloa.data.io import (
+    load_files, read_header, detect_header_length, read_data, show_column_selection, list_data_files,
+    save_modified_data, save_to_file, save_header, duplicate_file
+)
+
+# Content of the fake data file read by load_files, built once
+HEADER_COLUMNS = ["FieldUp", "UpRot", "UpEllipt", "IzeroUp"]
+HEADER_LINE    = "\t".join(HEADER_COLUMNS) + "\n"
 
 @pytest.fixture
 def fake_app():
@@ -30,6 +43,12 @@ def fake_app():
         logger=MagicMock()
     )
 
+@pytest.fixture
+def no_popups(monkeypatch):
+    # Silence the message boxes a test does not assert on
+    for name in ("information", "warning", "critical"):
+        monkeypatch.setattr(QMessageBox, name, lambda *args, **kwargs: None)
+
 
 def test_load_files_logger_missing():
     fake_app = MagicMock()
@@ -41,10 +60,8 @@ def test_load_files_logger_missing():
         assert "log" in critical_mock.call_args[0][2].lower()
 
 @patch("hyloa.data.io.QFileDialog.getOpenFileNames")
-@patch("hyloa.data.io.open", new_callable=mock_open, read_data="FieldUp\tUpRot\tUpEllipt\tIzeroUp\n")
 @patch("hyloa.data.io.show_column_selection")
-@patch("hyloa.data.io.detect_header_length", return_value=2)
-def test_load_files_success(mock_dhl, mock_show_columns, mock_open_fn, mock_getfiles, fake_app):
+def test_load_files_success(mock_show_columns, mock_getfiles, fake_app):
     # Mock selection of the file
     mock_getfiles.return_value = (["/fake/path/data1.txt"], "")
 
@@ -54,55 +71,116 @@ def test_load_files_success(mock_dhl, mock_show_columns, mock_open_fn, mock_getf
     # Logger 
     fake_app.logger = MagicMock()
 
-    load_files(fake_app)
+    reader = MagicMock(return_value=HEADER_COLUMNS)
+    load_files(fake_app, reader=reader)
 
     # Verify call of QFileDialog
     mock_getfiles.assert_called_once()
+    assert mock_getfiles.call_args[1]["options"] == io_module.FILE_DIALOG_OPTIONS
 
-    # Verify the opening of the file
-    mock_open_fn.assert_called_once_with("/fake/path/data1.txt", "r", encoding='utf-8')
+    # Verify the reading of the file
+    reader.assert_called_once_with("/fake/path/data1.txt")
 
     # Verify the call of show_column_selection
     mock_show_columns.assert_called_once()
     args = mock_show_columns.call_args[0]
     assert args[0] == fake_app                                     # app_instance
     assert args[1] == "/fake/path/data1.txt"                       # file_path
-    assert args[2] == ["FieldUp", "UpRot", "UpEllipt", "IzeroUp"]  # header
+    assert args[2] == HEADER_COLUMNS                               # header
+
+
+@patch("hyloa.data.io.QFileDialog.getOpenFileNames")
+@patch("hyloa.data.io.show_column_selection")
+def test_load_files_many_keeps_order(mock_show_columns, mock_getfiles, fake_app, tmp_path):
+    # Files are read in parallel but the dialogs must follow the selection order
+    paths = []
+    for i in range(12):
+        file = tmp_path / f"data{i}.txt"
+        file.write_text(f"a{i}\tb{i}\n1.0\t2.0\n")
+        paths.append(str(file))
+    mock_getfiles.return_value = (paths, "")
+
+    load_files(fake_app)
+
+    calls = mock_show_columns.call_args_list
+    assert [c[0][1] for c in calls] == paths
+    assert [c[0][2] for c in calls] == [[f"a{i}", f"b{i}"] for i in range(12)]
+
+
+@patch("hyloa.data.io.QFileDialog.getOpenFileNames")
+@patch("hyloa.data.io.show_column_selection")
+def test_load_files_shares_column_names(mock_show_columns, mock_getfiles, fake_app, tmp_path):
+    # Two files with the same schema get the very same name objects
+    paths = []
+    for i in range(2):
+        file = tmp_path / f"loop{i}.txt"
+        file.write_text(HEADER_LINE + "1\t2\t3\t4\n")
+        paths.append(str(file))
+    mock_getfiles.return_value = (paths, "")
+
+    load_files(fake_app)
+
+    first, second = (c[0][2] for c in mock_show_columns.call_args_list)
+    assert first == HEADER_COLUMNS
+    assert all(a is b for a, b in zip(first, second))
 
 
 @patch("hyloa.data.io.QMessageBox.question")
 @patch("hyloa.data.io.QFileDialog.getOpenFileNames")
-@patch("hyloa.data.io.open", new_callable=mock_open, read_data="FieldUp\tUpRot\tUpEllipt\tIzeroUp\n")
 @patch("hyloa.data.io.show_column_selection")
-@patch("hyloa.data.io.detect_header_length", return_value=2)
 def test_load_files_file_already_loaded(
-    mock_dhl, mock_show_columns, mock_open_fn, mock_getfiles, mock_question, fake_app
+    mock_show_columns, mock_getfiles, mock_question, fake_app
     ):
     # Simulates selection of existing file
     mock_getfiles.return_value = (["/fake/path/data1.txt"], "")
     mock_question.return_value = QMessageBox.Yes 
 
     # Already loaded file
-    df = pd.DataFrame([[0, 1, 1, 1]], columns=["FieldUp", "UpRot", "UpEllipt", "IzeroUp"])
+    df = pd.DataFrame([[0, 1, 1, 1]], columns=HEADER_COLUMNS)
     df.attrs["filename"] = "data1.txt"
     fake_app.dataframes = [df]
     fake_app.logger = MagicMock()
 
-    load_files(fake_app)
+    reader = MagicMock(return_value=HEADER_COLUMNS)
+    load_files(fake_app, reader=reader)
 
     mock_getfiles.assert_called_once()
     mock_question.assert_called_once()
-    mock_open_fn.assert_called_once_with("/fake/path/data1.txt", "r", encoding='utf-8')
+    reader.assert_called_once_with("/fake/path/data1.txt")
     mock_show_columns.assert_called_once()
 
     # Button for no
     mock_question.return_value = QMessageBox.No
 
-    load_files(fake_app)
+    load_files(fake_app, reader=reader)
     mock_getfiles.assert_called()
     mock_question.assert_called()
 
 
+def test_list_data_files_filters_by_extension(tmp_path):
+    for name in ["b.txt", "a.CSV", "c.dat", "image.png", "notes.md"]:
+        (tmp_path / name).write_text("x")
+    (tmp_path / "folder.txt").mkdir()
+
+    assert list_data_files(str(tmp_path)) == ["a.CSV", "b.txt", "c.dat"]
+
+
+@patch("hyloa.data.io.QFileDialog.getOpenFileNames")
+@patch("hyloa.data.io.show_column_selection")
+def test_load_files_fast_picker(mock_show_columns, mock_getfiles, fake_app, tmp_path, monkeypatch):
+    # With the env variable set the Qt file dialog is not used
+    file = tmp_path / "data.txt"
+    file.write_text(HEADER_LINE + "1\t2\t3\t4\n")
+    monkeypatch.setenv("HYLOA_FAST_PICKER", "1")
+
+    with patch("hyloa.data.io.pick_files_fast", return_value=[str(file)]) as mock_pick:
+        load_files(fake_app)
+
+    mock_pick.assert_called_once()
+    mock_getfiles.assert_not_called()
+    assert mock_show_columns.call_args[0][1] == str(file)
+
+
 @patch("hyloa.data.io.QFileDialog.getOpenFileNames", return_value=([], ""))
 def test_load_files_cancel_dialog(mock_getfiles, fake_app):
     load_files(fake_app)
@@ -111,16 +189,14 @@ def test_load_files_cancel_dialog(mock_getfiles, fake_app):
 
 @patch("hyloa.data.io.QFileDialog.getOpenFileNames")
 @patch("hyloa.data.io.QMessageBox.critical")
-@patch("hyloa.data.io.open", side_effect=Exception("Test error"))
-@patch("hyloa.data.io.detect_header_length", return_value=2)
-def test_load_files_open_raises(mock_dhl, mock_open_fn, mock_critical, mock_getfiles, fake_app):
+def test_load_files_open_raises(mock_critical, mock_getfiles, fake_app):
     # Fake file
     mock_getfiles.return_value = (["/fake/path/data1.txt"], "")
 
     # mock logger
     fake_app.logger = MagicMock()
 
-    load_files(fake_app)
+    load_files(fake_app, reader=MagicMock(side_effect=Exception("Test error")))
 
     # exception handling test
     mock_critical.assert_called_once()
@@ -129,6 +205,18 @@ def test_load_files_open_raises(mock_dhl, mock_open_fn, mock_critical, mock_getf
     assert "data1.txt" in error_message
 
 
+@pytest.mark.parametrize("content, expected", [
+    (HEADER_LINE + "1\t2\t3\t4\n", HEADER_COLUMNS),
+    ("1.0\t2.0\t3.0\n4.0\t5.0\t6.0\n", ["col_0", "col_1", "col_2"]),
+])
+def test_read_header(tmp_path, content, expected):
+    # Names from the first line, or default ones when there is no header
+    file = tmp_path / "data.txt"
+    file.write_text(content)
+
+    assert read_header(str(file)) == expected
+
+
 def test_detect_header_length_with_clean_header(tmp_path):
     #Create a tmp file
     content = """
@@ -200,6 +288,78 @@ def test_detect_header_is_numeric_row(tmp_path):
     # No header, no empty lines → 0 - 1 - 0 = -1
     assert result == -1
 
+def test_detect_header_length_cached_until_modified(tmp_path, monkeypatch):
+    # A second call on the same file must not scan it again
+    file = tmp_path / "cached.txt"
+    file.write_text("a\tb\n1.0\t2.0\n")
+
+    scans     = []
+    real_scan = io_module._scan_header_length
+
+    def counting_scan(path, sep):
+        scans.append(path)
+        return real_scan(path, sep)
+
+    monkeypatch.setattr(io_module, "_scan_header_length", counting_scan)
+
+    assert detect_header_length(file) == 0
+    assert detect_header_length(file) == 0
+    assert len(scans) == 1
+
+    # Rewriting the file changes its size and so the cache key
+    file.write_text("# comment\na\tb\n1.0\t2.0\n")
+    assert detect_header_length(file) == 1
+    assert len(scans) == 2
+
+def test_read_data_falls_back_to_c_engine(tmp_path, monkeypatch):
+    # Simulate pyarrow missing: the first call must be retried without engine
+    file = tmp_path / "data.txt"
+    file.write_text("a\tb\n1.0\t2.0\n3.0\t4.0\n")
+
+    calls     = []
+    real_read = pd.read_csv
+
+    def fake_read_csv(path, **kwargs):
+        calls.append(kwargs.get("engine"))
+        if kwargs.get("engine") == "pyarrow":
+            raise ImportError("pyarrow")
+        return real_read(path, **kwargs)
+
+    monkeypatch.setattr(pd, "read_csv", fake_read_csv)
+    df = read_data(file)
+
+    assert calls == ["pyarrow", None]
+    assert list(df.columns) == ["a", "b"]
+    assert np.array_equal(df["b"].to_numpy(), [2.0, 4.0])
+
+def test_show_column_selection_reads_only_selected(qtbot, tmp_path, no_popups):
+    # The file is read in full only on submit and only for the chosen columns
+    file = tmp_path / "loop.txt"
+    file.write_text("H\tM\tT\nOe\temu\tK\n1.0\t2.0\t3.0\n4.0\t5.0\t6.0\n")
+
+    app = MagicMock()
+    app.dataframes   = []
+    app.header_lines = []
+
+    with patch("hyloa.data.io.read_data", wraps=read_data) as mock_read:
+
+        show_column_selection(app, str(file), ["H", "M", "T"])
+        mock_read.assert_not_called()
+
+        dialog = [
+            w for w in QApplication.topLevelWidgets()
+            if w.windowTitle() == "Select Columns: loop.txt"
+        ][-1]
+        qtbot.addWidget(dialog)
+        checkboxes = {c.text(): c for c in dialog.findChildren(QCheckBox)}
+        checkboxes["T"].setChecked(False)
+        [b for b in dialog.findChildren(QPushButton) if b.text() == "Load"][0].click()
+
+    mock_read.assert_called_once_with(str(file), usecols=["H", "M"])
+    assert list(app.dataframes[0].columns) == ["loop_H", "loop_M"]
+    assert app.dataframes[0]["loop_M"].tolist() == ["2.0", "5.0"]
+    assert app.dataframes[0].index.tolist() == [1, 2]
+
 #======================================================================#
 #======================================================================#
 #======================================================================#
@@ -212,15 +372,14 @@ class DummyApp:
         self.logger = MagicMock()
 
 
-@patch("hyloa.data.io.clean_column_name")
 @patch("hyloa.data.io.save_header")
-@patch("hyloa.data.io.np.savetxt")
 @patch("hyloa.data.io.QFileDialog.getSaveFileName")
 @patch("hyloa.data.io.QMessageBox.information")
+@pytest.mark.parametrize("file_name", ["output.txt", "output"])
 def test_save_to_file_success(
-    mock_info, mock_dialog, mock_savetxt, mock_save_header, mock_clean_col, tmp_path
+    mock_info, mock_dialog, mock_save_header, file_name, tmp_path
 ):
-    """Test successful save operation."""
+    """Test successful save operation, adding .txt extension if missing."""
     # Arrange
     test_df = pd.DataFrame({
         "A": [1.0, 2.0],
@@ -232,10 +391,7 @@ def test_save_to_file_success(
     app_instance = DummyApp([test_df], header_lines)
 
     fake_file = tmp_path / "output.txt"
-    mock_dialog.return_value = (str(fake_file), "")
-    
-    # Mock clean_column_name to return the column name unchanged for simplicity
-    mock_clean_col.side_effect = lambda x, y: x
+    mock_dialog.return_value = (str(tmp_path / file_name), "")
 
     # Act
     save_to_file(0, app_instance, parent_widget=None)
@@ -252,16 +408,46 @@ def test_save_to_file_success(
     assert isinstance(args[2], pd.DataFrame)
     assert args[3] == str(fake_file)
 
-    # Assert: np.savetxt was called
-    mock_savetxt.assert_called_once()
-    savetxt_args = mock_savetxt.call_args[0]
-    assert savetxt_args[1].shape == (2, 2)  # 2 rows, 2 columns
+    # Assert: the data was appended, 2 rows, 2 columns
+    assert fake_file.read_text(encoding="utf-8") == "1.0\t3.0\n2.0\t4.0\n"
 
     # Assert: success message shown
     mock_info.assert_called_once()
     assert str(fake_file) in mock_info.call_args[0][2]
 
 
+@patch("hyloa.data.io.QFileDialog.getSaveFileName")
+@patch("hyloa.data.io.QMessageBox.information")
+def test_save_to_file_skips_unchanged(mock_info, mock_dialog, tmp_path):
+    """Saving the same data twice to the same file writes it only once."""
+    test_df = pd.DataFrame({"A": [1.0, 2.0], "B": [3.0, 4.0]})
+    test_df.attrs["filename"] = "test_file.txt"
+    app_instance = DummyApp([test_df], [["A", "B"]])
+
+    out = tmp_path / "output.txt"
+    mock_dialog.return_value = (str(out), "")
+
+    with patch("hyloa.data.io.save_header", wraps=save_header) as mock_save_header:
+        save_to_file(0, app_instance)
+        save_to_file(0, app_instance)
+        assert mock_save_header.call_count == 1
+
+        # New data must be written again
+        test_df.loc[0, "A"] = 5.0
+        save_to_file(0, app_instance)
+        assert mock_save_header.call_count == 2
+
+        # As well as a file changed by someone else
+        out.write_text("edited\n")
+        save_to_file(0, app_instance)
+        assert mock_save_header.call_count == 3
+
+    assert out.read_text(encoding="utf-8") == "A\tB\n5.0\t3.0\n2.0\t4.0\n"
+    assert mock_info.call_count == 4
+    # The record of the save does not end up in the session
+    assert set(test_df.attrs) == {"filename"}
+
+
 @patch("hyloa.data.io.QFileDialog.getSaveFileName")
 @patch("hyloa.data.io.QMessageBox.warning")
 def test_save_to_file_cancel(mock_warning, mock_dialog):
@@ -282,42 +468,10 @@ def test_save_to_file_cancel(mock_warning, mock_dialog):
     assert "Canceled" in mock_warning.call_args[0][1]
 
 
-@patch("hyloa.data.io.clean_column_name")
-@patch("hyloa.data.io.save_header")
-@patch("hyloa.data.io.np.savetxt")
-@patch("hyloa.data.io.QFileDialog.getSaveFileName")
-@patch("hyloa.data.io.QMessageBox.information")
-def test_save_to_file_adds_txt_extension(
-    mock_info, mock_dialog, mock_savetxt, mock_save_header, mock_clean_col, tmp_path
-):
-    """Test that .txt extension is added if missing."""
-    # Arrange
-    test_df = pd.DataFrame({"A": [1.0, 2.0]})
-    test_df.attrs["filename"] = "test.txt"
-    
-    app_instance = DummyApp([test_df], ["# header\n"])
-    
-    fake_file = tmp_path / "output"  # without .txt extension
-    mock_dialog.return_value = (str(fake_file), "")
-    mock_clean_col.side_effect = lambda x, y: x
-
-    # Act
-    save_to_file(0, app_instance, parent_widget=None)
-
-    # Assert: .txt extension was added
-    args = mock_save_header.call_args[0]
-    file_path = args[3]
-    assert file_path.endswith(".txt")
-
-
-@patch("hyloa.data.io.clean_column_name")
-@patch("hyloa.data.io.save_header")
-@patch("hyloa.data.io.np.savetxt", side_effect=IOError("Permission denied"))
+@patch("hyloa.data.io.pd.DataFrame.to_csv", side_effect=IOError("Permission denied"))
 @patch("hyloa.data.io.QFileDialog.getSaveFileName")
 @patch("hyloa.data.io.QMessageBox.critical")
-def test_save_to_file_error_handling(
-    mock_critical, mock_dialog, mock_savetxt, mock_save_header, mock_clean_col
-):
+def test_save_to_file_error_handling(mock_critical, mock_dialog, mock_to_csv, tmp_path):
     """Test error handling when save fails."""
     # Arrange
     test_df = pd.DataFrame({"A": [1.0, 2.0]})
@@ -325,8 +479,7 @@ def test_save_to_file_error_handling(
 
     app_instance = DummyApp([test_df], ["# header\n"])
 
-    mock_dialog.return_value = ("/path/to/file.txt", "")
-    mock_clean_col.side_effect = lambda x, y: x
+    mock_dialog.return_value = (str(tmp_path / "file.txt"), "")
 
     # Act
     save_to_file(0, app_instance, parent_widget=None)
@@ -339,11 +492,9 @@ def test_save_to_file_error_handling(
 
 @patch("hyloa.data.io.clean_column_name")
 @patch("hyloa.data.io.save_header")
-@patch("hyloa.data.io.np.savetxt")
 @patch("hyloa.data.io.QFileDialog.getSaveFileName")
-@patch("hyloa.data.io.QMessageBox.information")
 def test_save_to_file_correct_dataframe_passed(
-    mock_info, mock_dialog, mock_savetxt, mock_save_header, mock_clean_col
+    mock_dialog, mock_save_header, mock_clean_col, tmp_path, no_popups
 ):
     """Test that the correct dataframe is passed to save_header."""
     # Arrange
@@ -356,7 +507,7 @@ def test_save_to_file_correct_dataframe_passed(
     
     app_instance = DummyApp([test_df], ["# header\n"])
     
-    mock_dialog.return_value = ("/tmp/output.txt", "")
+    mock_dialog.return_value = (str(tmp_path / "output.txt"), "")
     mock_clean_col.side_effect = lambda x, y: f"cleaned_{x}"
 
     # Act
@@ -371,6 +522,38 @@ def test_save_to_file_correct_dataframe_passed(
 
 
 
+def test_save_modified_data_no_data():
+    app = DummyApp([], None)
+
+    with patch("hyloa.data.io.QMessageBox.critical") as mock_critical:
+        save_modified_data(app, None)
+
+    mock_critical.assert_called_once()
+
+
+def test_save_modified_data_saves_selected(qtbot):
+    # The modal loop is replaced by a synchronous click on "Save"
+    frames = [pd.DataFrame({"A": [1.0]}), pd.DataFrame({"B": [2.0], "C": [3.0]})]
+    app    = DummyApp(frames, [None, None])
+    shown  = {}
+
+    def fake_exec(dialog):
+        qtbot.addWidget(dialog)
+        combo = dialog.findChild(QComboBox)
+        combo.setCurrentIndex(1)
+        columns = dialog.findChild(QListWidget)
+        shown["columns"] = [columns.item(i).text() for i in range(columns.count())]
+        [b for b in dialog.findChildren(QPushButton) if b.text() == "Save"][0].click()
+        return QDialog.Accepted
+
+    with patch("hyloa.data.io.QDialog.exec_", fake_exec), \
+         patch("hyloa.data.io.save_to_file") as mock_save:
+        save_modified_data(app, None)
+
+    assert shown["columns"] == ["B", "C"]
+    mock_save.assert_called_once_with(1, app, None)
+
+
 def test_save_header_success(tmp_path):
     # Arrange
     df = pd.DataFrame({
@@ -383,20 +566,25 @@ def test_save_header_success(tmp_path):
     # Call
     save_header(app, header ,df, str(file_path))
 
-    # Assert
-    assert file_path.exists()
-
-    with open(file_path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-    
-
-    assert lines[0].strip() == "col1\tcol2"
-    
+    # Assert: the header is a list, so only the column names are written
+    assert file_path.read_text(encoding="utf-8") == "col1\tcol2\n"
 
     # Logger call
     app.logger.info.assert_called_with(f"File saved successfully in: {file_path}")
 
 
+def test_save_header_with_header_rows(tmp_path):
+    # The header rows are written after the names, NaN cells left empty
+    df        = pd.DataFrame({"A": [1.0], "B": [2.0]})
+    header_df = pd.DataFrame({"h1": ["unit", "note"], "h2": ["V", np.nan]})
+    app       = DummyApp(None, None)
+    file_path = tmp_path / "output.txt"
+
+    save_header(app, header_df, df, str(file_path))
+
+    assert file_path.read_text(encoding="utf-8") == "A\tB\nunit\tV\nnote\n"
+
+
 def test_save_header_exception(tmp_path):
     
     app = DummyApp(None, None)
@@ -17,8 +17,6 @@
 """
 Test log window widget.
 """
-import os
-import tempfile
 import pytest
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QTextCursor
@@ -31,6 +29,20 @@ class DummyApp:
     def __init__(self, logger_path=None):
         self.logger_path = logger_path
 
+@pytest.fixture
+def log_file(tmp_path):
+    # One line buffered handle kept open for the whole test
+    path = tmp_path / "log.txt"
+    with open(path, "a+", buffering=1, encoding="utf-8") as f:
+        yield str(path), f
+
+def make_window(qtbot, logger_path=None):
+    # The polling timer is stopped, tests call update_log themselves
+    widget = LogWindow(DummyApp(logger_path=logger_path))
+    qtbot.addWidget(widget)
+    widget.timer.stop()
+    return widget
+
 
 def test_initialization(qtbot):
     app = DummyApp()
@@ -41,12 +53,11 @@ def test_initialization(qtbot):
     assert widget.styleSheet() != ""
     assert widget.timer.isActive()
     assert widget.last_line_count == 0
+    widget.timer.stop()
 
 
 def test_update_log_no_path(qtbot):
-    app = DummyApp(logger_path=None)
-    widget = LogWindow(app)
-    qtbot.addWidget(widget)
+    widget = make_window(qtbot)
 
     widget.setPlainText("initial")
     widget.update_log()
@@ -55,16 +66,11 @@ def test_update_log_no_path(qtbot):
     assert widget.last_line_count == 0
 
 
-def test_update_log_new_lines(qtbot):
-    # Create a tmp file
-    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as tmp:
-        tmp.write("INFO - first line\n")
-        tmp.write("DEBUG - second line\n")
-        tmp_path = tmp.name
+def test_update_log_new_lines(qtbot, log_file):
+    path, f = log_file
+    f.write("INFO - first line\nDEBUG - second line\n")
 
-    app = DummyApp(logger_path=tmp_path)
-    widget = LogWindow(app)
-    qtbot.addWidget(widget)
+    widget = make_window(qtbot, path)
 
     widget.update_log()
 
@@ -73,17 +79,12 @@ def test_update_log_new_lines(qtbot):
     assert "second line" in widget.toPlainText()
     assert widget.last_line_count == 2
 
-    os.remove(tmp_path)
-
 
-def test_update_log_no_new_lines(qtbot):
-    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as tmp:
-        tmp.write("INFO - hello\n")
-        tmp_path = tmp.name
+def test_update_log_no_new_lines(qtbot, log_file):
+    path, f = log_file
+    f.write("INFO - hello\n")
 
-    app = DummyApp(logger_path=tmp_path)
-    widget = LogWindow(app)
-    qtbot.addWidget(widget)
+    widget = make_window(qtbot, path)
 
     widget.update_log()
     first_text = widget.toPlainText()
@@ -95,19 +96,12 @@ def test_update_log_no_new_lines(qtbot):
     assert first_text == second_text
     assert widget.last_line_count == 1
 
-    os.remove(tmp_path)
 
+def test_update_log_scroll_behavior(qtbot, log_file):
+    path, f = log_file
+    f.write("INFO - line1\nINFO - line2\nINFO - line3\n")
 
-def test_update_log_scroll_behavior(qtbot):
-    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as tmp:
-        tmp.write("INFO - line1\n")
-        tmp.write("INFO - line2\n")
-        tmp.write("INFO - line3\n")
-        tmp_path = tmp.name
-
-    app = DummyApp(logger_path=tmp_path)
-    widget = LogWindow(app)
-    qtbot.addWidget(widget)
+    widget = make_window(qtbot, path)
 
     # first update
     widget.update_log()
@@ -116,21 +110,18 @@ def test_update_log_scroll_behavior(qtbot):
     sb = widget.verticalScrollBar()
     sb.setValue(0)
 
-    with open(tmp_path, "a") as f:
-        f.write("INFO - new line\n")
+    # Same handle, no reopening of the file
+    f.write("INFO - new line\n")
 
     widget.update_log()
+    assert widget.last_line_count == 4
     # scrollbar should remain at top
     assert sb.value() == 0
 
-    os.remove(tmp_path)
-
 
 def test_update_log_error_handling(qtbot):
     # Non-existent file path should trigger error handling
-    app = DummyApp(logger_path="/nonexistent/path/log.txt")
-    widget = LogWindow(app)
-    qtbot.addWidget(widget)
+    widget = make_window(qtbot, "/nonexistent/path/log.txt")
 
     widget.update_log()
 
@@ -17,10 +17,9 @@
 """
 test for logger
 """
-import time
 import pytest
 import logging
-from hyloa.utils.logging_setup import setup_logging, start_logging
+from hyloa.utils.logging_setup import setup_logging, start_logging, stop_logging
 
 # Test setup_logging() to ensure it creates a file and logs messages to it
 def test_setup_logging(tmp_path):
@@ -35,12 +34,8 @@ def test_setup_logging(tmp_path):
     logger.setLevel(logging.INFO)
     logger.info("Test message")
 
-    # Give the file system a moment to write (sometimes needed on CI)
-    time.sleep(0.1)
-
-    # Flush all handlers to ensure writing is complete
-    for handler in logger.handlers:
-        handler.flush()
+    # Drain the queue and close the file, so the content is complete
+    stop_logging()
 
     # Assert the file exists and contains the test message
     assert log_file.exists(), "Log file was not created"
@@ -77,9 +72,8 @@ def test_start_logging_success(monkeypatch, tmp_path):
     # Write a log message to trigger file creation
     app.logger.info("Test entry for file creation")
 
-    time.sleep(0.1)
-    for handler in app.logger.handlers:
-        handler.flush()
+    # Drain the queue and close the file, so the content is complete
+    stop_logging()
 
     # Assert the log file was created and contains the test message
     assert selected_file.exists(), "Selected log file was not created"
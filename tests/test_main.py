@@ -17,30 +17,50 @@
 """
 Test entry point
 """
-import time
+import sys
 import pytest
+import subprocess
+from unittest.mock import MagicMock
 from PyQt5.QtGui import QPixmap
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QPoint
 
-from hyloa.main import *
+import hyloa
+from hyloa.main import main
+from hyloa.gui.splash import Splash
 
 
-def test_splash_creation(qtbot):
-    pixmap = QPixmap(100, 100)
+@pytest.fixture(scope="module")
+def pixmap(qapp):
+    # Read only for the Splash, so one image serves every test
+    return QPixmap(100, 100)
+
+
+@pytest.fixture(scope="module")
+def shared_splash(pixmap):
+    # One Splash for the checks that only read its state or set the value.
+    # The timer is stopped so the bar moves only when a test asks for it
     splash = Splash(pixmap)
+    splash._timer.stop()
 
-    qtbot.addWidget(splash)
+    yield splash
 
-    assert splash.windowFlags() & Qt.FramelessWindowHint
-    assert splash.progress.value() == 0
+    splash.close()
+    splash.deleteLater()
 
 
-def test_progress_update(qtbot):
-    pixmap = QPixmap(100, 100)
-    splash = Splash(pixmap)
+@pytest.fixture
+def splash(shared_splash):
+    # Back to the initial state, whatever the previous test did
+    shared_splash.set_progress(0)
+    return shared_splash
+
+
+def test_splash_creation(splash):
+    assert splash.windowFlags() & Qt.FramelessWindowHint
+    assert splash.progress.value() == 0
 
-    qtbot.addWidget(splash)
 
+def test_progress_update(splash):
     splash.set_progress(50)
     assert splash.progress.value() == 50
 
@@ -48,31 +68,94 @@ def test_progress_update(qtbot):
     assert splash.progress.value() == 100
 
 
-def test_progress_format(qtbot):
-    pixmap = QPixmap(100, 100)
-    splash = Splash(pixmap)
+def test_progress_format(splash):
+    assert splash.progress.isTextVisible()
+    assert splash.progress.format() == "%p%"
+
+
+def test_progress_follows_elapsed_time(qtbot, pixmap):
+    splash = Splash(pixmap, min_splash_time=1.0)
 
     qtbot.addWidget(splash)
 
-    assert splash.progress.isTextVisible()
-    assert splash.progress.format() == "%p%"
+    # Half of the minimum time has passed
+    splash.start_time -= 0.5
+    splash._tick()
+    assert 45 <= splash.progress.value() <= 95
+
+    # The bar never fills before the loading is finished
+    splash.start_time -= 10
+    splash._tick()
+    assert splash.progress.value() == 95
+
+    splash.finish()
+    assert splash.progress.value() == 100
+    assert not splash._timer.isActive()
+
+
+def test_progress_keeps_loading_stage(splash):
+    # A stage reached while loading is not undone by the timer
+    splash.set_progress(60)
+    splash._tick()
+    assert splash.progress.value() >= 60
+
+
+def test_splash_centered_on_point(qtbot, pixmap):
+    center = QPoint(400, 300)
+    splash = Splash(pixmap, center)
+
+    qtbot.addWidget(splash)
+
+    assert splash.pos() == center - splash.rect().center()
+
+
+@pytest.mark.parametrize("flag", ["-V", "--version"])
+def test_version_flag_skips_gui(flag, monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["hyloa", flag])
+    # Any Qt import on this path fails the test
+    monkeypatch.setitem(sys.modules, "PyQt5.QtWidgets", None)
+
+    main()
+
+    assert capsys.readouterr().out.strip() == f"hyloa {hyloa.__version__}"
+
+
+def test_help_flag_skips_gui(monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["hyloa", "--help"])
+    # Any Qt import on this path fails the test
+    monkeypatch.setitem(sys.modules, "PyQt5.QtWidgets", None)
+
+    main()
 
+    assert "--no-splash" in capsys.readouterr().out
 
 
-def test_remaining_time_positive():
-    start = time.monotonic()
-    time.sleep(0.1)
+def test_no_splash_opens_main_window(monkeypatch):
+    monkeypatch.setattr("sys.argv", ["hyloa", "--no-splash"])
+    # Restored after the test, main sets it for high DPI scaling
+    monkeypatch.setenv("QT_AUTO_SCREEN_SCALE_FACTOR", "0")
 
-    remaining = compute_remaining_time(start, 1.0)
+    # The session already has a QApplication, and exec_ must not block
+    app_cls  = MagicMock()
+    app_cls.return_value.exec_.return_value = 0
+    main_app = MagicMock()
+    splash   = MagicMock()
+    monkeypatch.setattr("PyQt5.QtWidgets.QApplication", app_cls)
+    monkeypatch.setattr("hyloa.gui.main_window.MainApp", main_app)
+    monkeypatch.setattr("hyloa.gui.splash.Splash", splash)
 
-    assert remaining > 0
-    assert remaining <= 1000
+    with pytest.raises(SystemExit) as exit_info:
+        main()
 
+    assert exit_info.value.code == 0
+    splash.assert_not_called()
+    main_app.return_value.show.assert_called_once()
+    app_cls.return_value.exec_.assert_called_once()
 
-def test_remaining_time_zero_when_expired():
-    start = time.monotonic()
-    time.sleep(0.2)
 
-    remaining = compute_remaining_time(start, 0.1)
+def test_import_does_not_load_qt():
+    # Fresh interpreter, the test session has already imported Qt
+    code = "import sys, hyloa.main; print('PyQt5' in sys.modules)"
+    out  = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
 
-    assert remaining == 0
+    assert out.stdout.strip() == "False"
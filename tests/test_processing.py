@@ -18,36 +18,84 @@
 Test data Processing
 """
 import pytest
+import logging
 import numpy as np
 import pandas as pd
 
+from scipy.special import expit
+
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QTimer
-from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import QRegularExpression
+from PyQt5.QtWidgets import QWidget, QDialog, QCheckBox, QPushButton
+
+from hyloa.data.processing import (
+    norm_dialog, pick_y_columns, apply_norm, apply_loop_closure,
+    apply_column_inversion,
+)
+
+
+class _Logger:
+    ''' Logger stand-in for tests that do not check the log '''
+    def info(self, *args, **kwargs):
+        pass
+
+def _app(df):
+    # Plain attribute access, no call tracking as with MagicMock
+    return SimpleNamespace(dataframes=[df], logger=_Logger())
+
+# Real logger for the tests that check the messages through caplog
+_LOGGER = logging.getLogger("hyloa.tests.processing")
+
+def _check(state):
+    # Checkbox stand-in, only isChecked is used
+    return SimpleNamespace(isChecked=lambda: state)
+
 
+# Synthetic hysteresis loop, generated once at import.
+# The arrays are read-only: tests copy what they modify.
 
-from hyloa.data.processing import *
+# Data simulation
+_X     = np.linspace(-1, 1, 32)                  # Magnetic field
+_rng   = np.random.default_rng(69420)             # For reproducibility
+_noise = _rng.normal(0, 0.0005, size=_X.shape)  # Gaussian error
 
-@pytest.fixture
-def qapp():
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    return app
+# Creation of the two branches of the hysteresis loop
+# The sigmoid function is used to simulate the hysteresis loop
+# The noise is added to simulate the experimental error
+# The last term is a linear trend to simulate a drift
+# The -0.003 is due to the fact that the loop is always closed at one of the extreme points.
+_Y_UP = 0.025 + 0.015 * expit( 10 * (_X-0.25)) + _noise + (0.003*_X - 0.003)
+_Y_DW = 0.025 + 0.015 * expit(-10 * (_X[::-1]-0.25)) + _noise[::-1]
+
+for _arr in (_X, _Y_UP, _Y_DW):
+    _arr.setflags(write=False)
+
+
+def test_pick_y_columns():
+    # Two cycles of two branches each, only the second one is chosen
+    lines = [
+        SimpleNamespace(_cols=("X1", "Y1"), _file_index=0),
+        SimpleNamespace(_cols=("X2", "Y2"), _file_index=0),
+        SimpleNamespace(_cols=("X3", "Y3"), _file_index=1),
+        SimpleNamespace(_cols=("X4", "Y4"), _file_index=1),
+    ]
+
+    assert pick_y_columns(lines, [1]) == ([1], ["Y3", "Y4"])
+    assert pick_y_columns(lines, [])  == ([], [])
 
 
 @patch("hyloa.data.processing.apply_norm")
-def test_norm_dialog_even_columns(mock_apply_norm, qapp):
+def test_norm_dialog_even_columns(mock_apply_norm, qtbot):
     # Create a dummy DataFrame with 4 columns (2 x columns, 2 y columns)
-    df = pd.DataFrame(np.random.rand(10, 4), columns=["X1", "Y1", "X2", "Y2"])
+    df = pd.DataFrame(np.random.default_rng(0).random((10, 4)), columns=["X1", "Y1", "X2", "Y2"])
     
-    # Mock the app instance with one DataFrame
-    app_instance = MagicMock()
-    app_instance.dataframes = [df]
+    # App instance with one DataFrame
+    app_instance = _app(df)
 
     # Dummy QWidget as parent
     plot_instance = QWidget()
+    qtbot.addWidget(plot_instance)
     plot_instance.figure = MagicMock()
     plot_instance.ax = MagicMock()
     
@@ -69,14 +117,16 @@ def test_norm_dialog_even_columns(mock_apply_norm, qapp):
     plot_instance.ax.lines = [line1, line2]
     plot_instance.plot_customizations = {}
 
-    # Patch QDialog.exec_ to allow dialog interaction
+    # Patch QDialog.exec_: no modal loop, the dialog state is set directly
+    # and the apply slot runs synchronously through click()
     def fake_exec(self):
-        for cb in self.findChildren(QCheckBox):
+        for cb in self.findChildren(QCheckBox, QRegularExpression("^cycle_")):
             cb.setChecked(True)
 
         btn = self.findChild(QPushButton, "apply_button")
         assert btn is not None
         btn.click()
+        return QDialog.Accepted
 
     with patch("hyloa.data.processing.QDialog.exec_", new=fake_exec):
         norm_dialog(plot_instance, app_instance)
@@ -88,57 +138,37 @@ def test_norm_dialog_even_columns(mock_apply_norm, qapp):
     assert args[2][0] == [0]  # selected file index
     assert args[3] == ["Y1", "Y2"]  # selected columns
 
-    # I don't know but work
-    del df, app_instance, plot_instance
-
 
 
 
 @patch("hyloa.data.processing.QMessageBox.information")
-def test_apply_norm_applies_normalization(mock_info):
-    # Data simulation
-    x = np.linspace(-1, 1, 200)  # Magnetic field
-    np.random.seed(69420)        # For reproducibility
-    noise = np.random.normal(0, 0.0005, size=x.shape)  # Gaussian error
-    """
-    # Creation of the two branches of the hysteresis loop
-    # The sigmoid function is used to simulate the hysteresis loop
-    # The noise is added to simulate the experimental error
-    # The last term is a linear trend to simulate a drift
-    # The -0.003 is due to the fact that the loop is always closed at one of the extreme points.
-    """
-    y_up = 0.025 + 0.015 * (1 / (1 + np.exp(-10 * (x-0.25)))) + noise + (0.003*x - 0.003)
-    y_dw = 0.025 + 0.015 * (1 / (1 + np.exp( 10 * (x-0.25))))[::-1] + noise[::-1]
-
-    df = pd.DataFrame({"Y1": y_up, "Y2": y_dw})
-
-    # Create mock app_instance with logger and dataframes
-    mock_logger = MagicMock()
-    app_instance = MagicMock()
-    app_instance.dataframes = [df.copy()]  # Use a copy to verify modification
-    app_instance.logger = mock_logger
+def test_apply_norm_applies_normalization(mock_info, caplog):
+    df = pd.DataFrame(np.column_stack((_Y_UP, _Y_DW)), columns=["Y1", "Y2"])
+
+    # App instance with a real logger, its records are checked below
+    app_instance = SimpleNamespace(dataframes=[df], logger=_LOGGER)
 
     # Create mock plot_instance with a plot method
     plot_instance = MagicMock()
 
     # Apply normalization
-    apply_norm(plot_instance, app_instance, file_index=[0], selected_cols=["Y1", "Y2"])
+    with caplog.at_level(logging.INFO, logger=_LOGGER.name):
+        apply_norm(plot_instance, app_instance, file_index=[0], selected_cols=["Y1", "Y2"])
 
     # Assert that values have been updated in the dataframe
-    normed_y1 = app_instance.dataframes[0]["Y1"].values
-    normed_y2 = app_instance.dataframes[0]["Y2"].values
-    ampl_up   = abs(np.mean(normed_y1[:5])  + np.mean(normed_y2[:5]))/2
-    ampl_dw   = abs(np.mean(normed_y1[-5:]) + np.mean(normed_y2[-5:]))/2
-    assert ampl_up == pytest.approx(1, rel=1e-5)
-    assert ampl_dw == pytest.approx(1, rel=1e-5)
+    # Mean over both branches of the first and last 5 points must be +-1
+    normed = app_instance.dataframes[0][["Y1", "Y2"]].to_numpy()
+    ampl   = np.abs([normed[:5].mean(), normed[-5:].mean()])
+    np.testing.assert_allclose(ampl, 1, rtol=1e-5)
 
     # Assert that plot was called
     plot_instance.plot.assert_called_once()
 
-    # Assert that logger.info was called at least once for each column
-    assert mock_logger.info.call_count == 2
-    mock_logger.info.assert_any_call("Normalization applied to Y1.")
-    mock_logger.info.assert_any_call("Normalization applied to Y2.")
+    # Assert that one message was logged for each column, in order
+    assert caplog.messages == [
+        "Normalization applied to Y1.",
+        "Normalization applied to Y2.",
+    ]
 
     # Assert that success message was shown
     mock_info.assert_called_once()
@@ -149,9 +179,7 @@ def test_apply_norm_applies_normalization(mock_info):
 @patch("hyloa.data.processing.QMessageBox.critical")
 def test_apply_norm_handles_exception(mock_critical):
     # App instance with no dataframe
-    app_instance = MagicMock()
-    app_instance.logger = MagicMock()
-    app_instance.dataframes = [None]  
+    app_instance = _app(None)
 
     # Create mock plot_instance with a plot method
     plot_instance = MagicMock()
@@ -170,24 +198,8 @@ def test_apply_norm_handles_exception(mock_critical):
 
 @patch("hyloa.data.processing.QMessageBox.information")
 def test_apply_loop_closure_success(mock_info):
-
-    # Data simulation
-    x = np.linspace(-1, 1, 200)  # Magnetic field
-    np.random.seed(69420)        # For reproducibility
-    noise = np.random.normal(0, 0.0005, size=x.shape)  # Gaussian error
-    """
-    # Creation of the two branches of the hysteresis loop
-    # The sigmoid function is used to simulate the hysteresis loop
-    # The noise is added to simulate the experimental error
-    # The last term is a linear trend to simulate a drift
-    # The -0.003 is due to the fact that the loop is always closed at one of the extreme points.
-    """
-    y_up = 0.025 + 0.015 * (1 / (1 + np.exp(-10 * (x-0.25)))) + noise + (0.003*x - 0.003)
-    y_dw = 0.025 + 0.015 * (1 / (1 + np.exp( 10 * (x-0.25))))[::-1] + noise[::-1]
-
-
     # Call the function
-    y_up, y_dw = apply_loop_closure(y_up, y_dw)
+    y_up, y_dw = apply_loop_closure(_Y_UP, _Y_DW)
 
     # Create a sample dataframe with a simple loop structure
     df = pd.DataFrame({
@@ -195,84 +207,48 @@ def test_apply_loop_closure_success(mock_info):
         "Y2": y_dw
     })
 
-    # Prepare the mock application instance
-    app_instance = MagicMock()
-    app_instance.logger = MagicMock()
-    app_instance.dataframes = [df.copy()]
-
-    # Plot instance mock
-    plot_instance = MagicMock()
+    # Prepare the application instance
+    app_instance = _app(df)
 
     # Ensure that values have been updated
-    assert app_instance.dataframes[0]["Y1"].values[0] == pytest.approx(
-           app_instance.dataframes[0]["Y2"].values[0], rel=1e-3)
+    closed = app_instance.dataframes[0][["Y1", "Y2"]].to_numpy()
+    assert closed[0, 0] == pytest.approx(closed[0, 1], rel=1e-3)
 
 
 
 @patch("hyloa.data.processing.QMessageBox.information")
 @patch("hyloa.data.processing.QMessageBox.warning")
-def test_apply_column_inversion_valid(mock_warning, mock_info):
-    
-    # Data simulation
-    x = np.linspace(-1, 1, 200)  # Magnetic field
-    np.random.seed(69420)        # For reproducibility
-    noise = np.random.normal(0, 0.0005, size=x.shape)  # Gaussian error
-    """
-    # Creation of the two branches of the hysteresis loop
-    # The sigmoid function is used to simulate the hysteresis loop
-    # The noise is added to simulate the experimental error
-    # The last term is a linear trend to simulate a drift
-    # The -0.003 is due to the fact that the loop is always closed at one of the extreme points.
-    """
-    y_up = 0.025 + 0.015 * (1 / (1 + np.exp(-10 * (x-0.25)))) + noise + (0.003*x - 0.003)
-    y_dw = 0.025 + 0.015 * (1 / (1 + np.exp( 10 * (x-0.25))))[::-1] + noise[::-1]
-
+def test_apply_column_inversion_valid(mock_warning, mock_info, caplog):
     # Create a sample dataframe with a simple loop structure
-    df = pd.DataFrame({
-        "X1": x,
-        "Y1": y_up,
-        "X2": x,
-        "Y2": y_dw
-    })
+    # One contiguous (N, 4) buffer, so the frame holds a single float block
+    df = pd.DataFrame(np.column_stack((_X, _Y_UP, _X, _Y_DW)),
+                      columns=["X1", "Y1", "X2", "Y2"])
 
     # Simulate checkbox: 
-    cb_x1 = MagicMock()
-    cb_x1.isChecked.return_value = True
-    cb_y1 = MagicMock()
-    cb_y1.isChecked.return_value = True
-
-    cb_x2 = MagicMock()
-    cb_x2.isChecked.return_value = False
-    cb_y2 = MagicMock()
-    cb_y2.isChecked.return_value = False
-
     selected_columns = {
-        "X1": cb_x1,
-        "Y1": cb_y1,
-        "X2": cb_x2,
-        "Y2": cb_y2
+        "X1": _check(True),
+        "Y1": _check(True),
+        "X2": _check(False),
+        "Y2": _check(False)
     }
 
-    # Prepare the mock application instance
-    app_instance = MagicMock()
-    app_instance.logger = MagicMock()
-    app_instance.dataframes = [df.copy()]
+    # Prepare the application instance, the log records are checked
+    app_instance = SimpleNamespace(dataframes=[df], logger=_LOGGER)
 
     # Plot instance mock
     plot_instance = MagicMock()
 
-    apply_column_inversion(0, selected_columns, app_instance.dataframes,
-                            app_instance.logger, plot_instance)
+    with caplog.at_level(logging.INFO, logger=_LOGGER.name):
+        apply_column_inversion(0, selected_columns, app_instance.dataframes,
+                               app_instance.logger, plot_instance)
 
-    # Ensure that values have been updated
-    assert np.all(app_instance.dataframes[0]["Y1"].values == -y_up)
-    assert np.all(app_instance.dataframes[0]["Y2"].values == y_dw)
-    assert np.all(app_instance.dataframes[0]["X1"].values == -x)
-    assert np.all(app_instance.dataframes[0]["X2"].values == x)
+    # Ensure that values have been updated, only the checked columns change sign
+    result = app_instance.dataframes[0][["X1", "Y1", "X2", "Y2"]].to_numpy()
+    np.testing.assert_array_equal(result, np.column_stack((-_X, -_Y_UP, _X, _Y_DW)))
 
     # Check logger
-    app_instance.logger.info.assert_any_call("Reversing column X1 in file 1.")
-    app_instance.logger.info.assert_any_call("Reversing column Y1 in file 1.")
+    assert "Reversing column X1 in file 1." in caplog.messages
+    assert "Reversing column Y1 in file 1." in caplog.messages
 
     # Check that the plot was called
     plot_instance.plot.assert_called_once()
@@ -289,15 +265,11 @@ def test_apply_column_inversion_no_selection(mock_warning):
         "A": [1.0, 2.0]
     })
 
-    cb = MagicMock()
-    cb.isChecked.return_value = False
-
-    selected_columns = {"A": cb}
-    dataframes = [df.copy()]
-    logger = MagicMock()
+    selected_columns = {"A": _check(False)}
+    dataframes = [df]
     plot_instance = MagicMock()
 
-    apply_column_inversion(0, selected_columns, dataframes, logger, plot_instance)
+    apply_column_inversion(0, selected_columns, dataframes, _Logger(), plot_instance)
 
     # no inversion
     assert list(dataframes[0]["A"]) == [1.0, 2.0]
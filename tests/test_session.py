@@ -19,9 +19,12 @@ test for load and save session
 """
 
 import pytest
+import pickle
 import pandas as pd
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
+from hyloa.data import session as session_module
 from hyloa.data.session import save_current_session
 from hyloa.data.session import load_previous_session
 
@@ -45,25 +48,27 @@ def fake_app_instance():
     app.fit_results  = {"fit": "results"}
     app.number_plots = 1
 
-    # plot_widgets with selected_pairs and plot_customizations
-    combo_mock = MagicMock()
-    combo_mock.currentText.side_effect = ["f", "x", "y"]
-    plot_widget = MagicMock()
-    plot_widget.selected_pairs = [(combo_mock, combo_mock, combo_mock)]
-    plot_widget.plot_customizations.copy.return_value = {"style": "custom"}
+    # plot_widgets with selected_pairs and plot_customizations.
+    # Plain namespaces: only the attributes read by the session are needed
+    combos = [SimpleNamespace(currentText=lambda text=text: text) for text in ("f", "x", "y")]
+    plot_widget = SimpleNamespace(
+        selected_pairs      = [tuple(combos)],
+        plot_customizations = {"style": "custom"},
+    )
     app.plot_widgets = {0: plot_widget}
 
     app.plot_names = {0: "Plot 0"}
 
-    subwindow_mock                          = MagicMock()
-    subwindow_mock.x.return_value           = 0
-    subwindow_mock.y.return_value           = 0
-    subwindow_mock.width.return_value       = 400
-    subwindow_mock.height.return_value      = 300
-    subwindow_mock.isMinimized.return_value = False
+    subwindow = SimpleNamespace(
+        x           = lambda: 0,
+        y           = lambda: 0,
+        width       = lambda: 400,
+        height      = lambda: 300,
+        isMinimized = lambda: False,
+    )
 
-    app.plot_subwindows   = {0: subwindow_mock}
-    app.figure_subwindows = {0: subwindow_mock}
+    app.plot_subwindows   = {0: subwindow}
+    app.figure_subwindows = {0: subwindow}
 
     app.worksheet_windows = {}
     app.worksheet_names = {}
@@ -103,7 +108,10 @@ def test_save_successful(tmp_path, fake_app_instance):
         args, kwargs = dump_mock.call_args
         session = args[0]
 
+        assert kwargs.get("protocol") == pickle.HIGHEST_PROTOCOL
+
         assert "dataframes" in session
+        assert session["plot_widgets"][0]["selected_pairs"] == [("f", "x", "y")]
 
         info_mock.assert_called_once()
 
@@ -121,9 +129,12 @@ def test_save_raises_exception(fake_app_instance):
 
 
 
-@patch("hyloa.data.session.QMessageBox.warning")
-@patch("hyloa.data.session.QFileDialog.getOpenFileName", return_value=("", ""))
-def test_load_session_cancelled(mock_get_open, mock_warning):
+def test_load_session_cancelled(monkeypatch):
+    mock_get_open = MagicMock(return_value=("", ""))
+    mock_warning  = MagicMock()
+    monkeypatch.setattr(session_module.QFileDialog, "getOpenFileName", mock_get_open)
+    monkeypatch.setattr(session_module.QMessageBox, "warning", mock_warning)
+
     fake_app = MagicMock()
     
     load_previous_session(fake_app)
@@ -131,16 +142,18 @@ def test_load_session_cancelled(mock_get_open, mock_warning):
     mock_warning.assert_called_once()
     mock_get_open.assert_called_once()
 
-@patch("hyloa.data.session.QMessageBox.information")
-@patch("hyloa.data.session.PlotControlWidget")
-@patch("hyloa.data.session.pickle.load")
-@patch("builtins.open", create=True)
-@patch("hyloa.data.session.QFileDialog.getOpenFileName")
-def test_load_session_success(mock_get_open, mock_open, mock_pickle_load,
-                              mock_plotctrl, mock_info):
-    
-    mock_get_open.return_value = ("dummy_path.pkl", "")
-    
+def test_load_session_success(monkeypatch):
+    # Direct attribute swaps, undone by monkeypatch at teardown
+    mock_get_open    = MagicMock(return_value=("dummy_path.pkl", ""))
+    mock_open        = MagicMock()
+    mock_pickle_load = MagicMock()
+    mock_info        = MagicMock()
+    monkeypatch.setattr(session_module.QFileDialog, "getOpenFileName", mock_get_open)
+    monkeypatch.setattr("builtins.open", mock_open)
+    monkeypatch.setattr(session_module.pickle, "load", mock_pickle_load)
+    monkeypatch.setattr(session_module, "PlotControlWidget", MagicMock())
+    monkeypatch.setattr(session_module.QMessageBox, "information", mock_info)
+    monkeypatch.setattr(session_module, "setup_logging", MagicMock())
     
     fake_session = {
         "dataframes": [
@@ -197,12 +210,14 @@ def test_load_session_success(mock_get_open, mock_open, mock_pickle_load,
     mock_info.assert_called_once()
 
 
-@patch("hyloa.data.session.QMessageBox.critical")
-@patch("hyloa.data.session.pickle.load", side_effect=Exception("fake error"))
-@patch("builtins.open", create=True)
-@patch("hyloa.data.session.QFileDialog.getOpenFileName")
-def test_load_session_exception(mock_get_open, mock_open, mock_pickle_load, mock_critical):
-    mock_get_open.return_value = ("dummy_path.pkl", "")
+def test_load_session_exception(monkeypatch):
+    mock_critical = MagicMock()
+    monkeypatch.setattr(session_module.QFileDialog, "getOpenFileName",
+                        MagicMock(return_value=("dummy_path.pkl", "")))
+    monkeypatch.setattr("builtins.open", MagicMock())
+    monkeypatch.setattr(session_module.pickle, "load", MagicMock(side_effect=Exception("fake error")))
+    monkeypatch.setattr(session_module.QMessageBox, "critical", mock_critical)
+
     fake_app = MagicMock()
 
     load_previous_session(fake_app)
@@ -21,8 +21,8 @@ import pytest
 from hyloa.utils.err_format import format_value_error 
 
 
-@pytest.mark.parametrize("val, err, expected", [
-    
+# Cases as (val, err, expected); the expected string is also the test id
+CASES = [
     (1.234598,   0.01631,    "1.23(2)"),
     (1234.523,   12.0,       "1235(12)"),
     (2.0,        0.3,        "2.0(3)"),
@@ -35,9 +35,18 @@ from hyloa.utils.err_format import format_value_error
     (0.983493,   0.00021341, "9.835(2)e-1"),
     (1e-8,       3e-9,       "1.0(3)e-8"),
     (9.876e7,    2.3e6,      "9.9(2)e7"),
-    (2,          7423,       "2(7423)e0")
-])
+    (2,          7423,       "2(7423)e0"),
+    (-44449210.3, 228572.3,  "-4.44(2)e7"),
+    (0.2904697,  1e-06,      "2.90470(1)e-1")
+]
 
+@pytest.mark.parametrize("val, err, expected", CASES, ids=[case[2] for case in CASES])
 def test_format_value_error(val, err, expected):
     result = format_value_error(val, err)
     assert result == expected, f"Expected {expected}, got {result}"
+
+
+@pytest.mark.parametrize("err", [0.0, -0.1])
+def test_format_value_error_non_positive_error(err):
+    with pytest.raises(ValueError):
+        format_value_error(1.0, err)
@@ -0,0 +1,36 @@
+# This file is part of HYLOA - HYsteresis LOop Analyzer.
+# Copyright (C) 2024 Francesco Zeno Costanzo
+
+# HYLOA is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# HYLOA is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with HYLOA. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+test loading of the packaged images
+"""
+from PyQt5.QtGui import QPixmapCache
+
+from hyloa.utils.icons import load_pixmap
+
+
+def test_load_pixmap_is_cached(qapp):
+    QPixmapCache.clear()
+
+    pixmap = load_pixmap("icon-6.png")
+
+    assert not pixmap.isNull()
+    assert QPixmapCache.find("hyloa:icon-6.png") is not None
+    assert load_pixmap("icon-6.png").cacheKey() == pixmap.cacheKey()
+
+
+def test_load_pixmap_missing_file(qapp):
+    assert load_pixmap("missing.png").isNull()
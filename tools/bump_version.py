@@ -18,12 +18,21 @@
 Simple script to bump the version of the package.
 """
 
+import os
 import re
 import sys
 import subprocess
 from pathlib import Path
 from argparse import ArgumentParser
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11, tomllib is available as the tomli package
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
 BASE_DIR       = Path(__file__).resolve().parent
 PYPROJECT_PATH = BASE_DIR.parent / "pyproject.toml"
 INIT_PATH      = BASE_DIR.parent / "hyloa" / "__init__.py"
@@ -32,13 +41,26 @@ SETUP_PATH     = BASE_DIR.parent / "setup.py"
 INCREMENT_MODES = ('major', 'minor', 'patch')
 VERSION_PATTERN = r'(\d+)\.(\d+)\.(\d+)'
 
+# Compiled once; group 2 is the full version string
+INIT_VERSION_RE = re.compile(rf'(__version__\s*=\s*[\'"])({VERSION_PATTERN})([\'"])')
+VERSION_RE      = re.compile(rf'(version\s*=\s*[\'"])({VERSION_PATTERN})([\'"])')
+# Top level version key of pyproject.toml, used when no TOML parser is available
+PYPROJECT_VERSION_RE = re.compile(rf'^(version\s*=\s*[\'"])({VERSION_PATTERN})([\'"])', re.M)
+
 
-def read_version_from_init():
-    content = INIT_PATH.read_text()
-    match = re.search(r'__version__\s*=\s*[\'"]' + VERSION_PATTERN + r'[\'"]', content)
-    if not match:
-        raise RuntimeError("Version not found in __init__.py")
-    return '.'.join(match.groups())
+def read_version():
+    # pyproject.toml is the reference, the other files follow it
+    content = PYPROJECT_PATH.read_text()
+    if tomllib is None:
+        # Python < 3.11 without tomli
+        match = PYPROJECT_VERSION_RE.search(content)
+        if match is None:
+            raise RuntimeError("Version not found in pyproject.toml")
+        return match.group(2)
+    project = tomllib.loads(content).get("project", {})
+    if "version" not in project:
+        raise RuntimeError("Version not found in pyproject.toml")
+    return project["version"]
 
 
 def increment_version(version, mode):
@@ -53,15 +75,31 @@ def increment_version(version, mode):
         raise ValueError(f"Invalid mode: {mode}")
 
 
-def update_file(file_path, regex_pattern, new_version, label='version'):
-    content = file_path.read_text()
-    new_content = re.sub(
-        regex_pattern,
-        lambda m: m.group(0).replace(m.group(2), new_version),
-        content
-    )
-    file_path.write_text(new_content)
-    print(f" Updated {label} in {file_path}")
+def update_files(targets, new_version):
+    # Read and substitute everything first, then write:
+    # a read error leaves every file untouched
+    updates = []
+    for file_path, pattern, label in targets:
+        content = file_path.read_text()
+
+        # Already bumped (e.g. re-run after a failed push): no rewrite
+        match = pattern.search(content)
+        if match and match.group(2) == new_version:
+            print(f" {label} already at version {new_version}")
+            continue
+
+        new_content = pattern.sub(
+            lambda m: m.group(0).replace(m.group(2), new_version),
+            content
+        )
+        updates.append((file_path, new_content, label))
+
+    # Write to a temporary file and rename, no partially written file
+    for file_path, new_content, label in updates:
+        tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
+        tmp_path.write_text(new_content)
+        os.replace(tmp_path, file_path)
+        print(f" Updated {label} in {file_path}")
 
 
 def git_commit_and_push(new_version):
@@ -95,25 +133,15 @@ def main(mode):
     if mode not in INCREMENT_MODES:
         raise RuntimeError(f"Invalid mode: {mode}. Choose from {INCREMENT_MODES}")
 
-    old_version = read_version_from_init()
+    old_version = read_version()
     new_version = increment_version(old_version, mode)
     print(f"Bumping version from {old_version} to {new_version}")
 
-    update_file(INIT_PATH,
-                rf'(__version__\s*=\s*[\'"])({VERSION_PATTERN})([\'"])',
-                new_version,
-                label="__init__.py")
-
-    update_file(SETUP_PATH,
-                rf'(version\s*=\s*[\'"])({VERSION_PATTERN})([\'"])',
-                new_version,
-                label="setup.py")
-
-    update_file(PYPROJECT_PATH,
-                rf'(version\s*=\s*[\'"])({VERSION_PATTERN})([\'"])',
-                new_version,
-                label="pyproject.toml")
-    
+    update_files([
+        (INIT_PATH,      INIT_VERSION_RE, "__init__.py"),
+        (SETUP_PATH,     VERSION_RE,      "setup.py"),
+        (PYPROJECT_PATH, VERSION_RE,      "pyproject.toml"),
+    ], new_version)
 
     git_commit_and_push(new_version)
     git_create_and_push_tag(new_version)